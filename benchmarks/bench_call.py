@@ -0,0 +1,51 @@
+"""
+Times the interval lookup paths of PchipInterpolator.__call__.
+
+Usage: python benchmarks/bench_call.py [--size 10000000] [--knots 1000]
+"""
+import argparse
+import time
+
+import numpy as np
+import pchips
+
+
+def best_of(fn, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--size", type=int, default=10**7)
+    parser.add_argument("--knots", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    x = np.linspace(0.0, 100.0, args.knots)
+    interp = pchips.PchipInterpolator(x, np.sin(x / 10))
+    binary = pchips.PchipInterpolator(x, np.sin(x / 10))
+    binary._step = None
+
+    rng = np.random.default_rng(0)
+    u_random = rng.uniform(x[0] - 1, x[-1] + 1, args.size)
+    u_sorted = np.linspace(x[0] - 1, x[-1] + 1, args.size)
+
+    cases = [
+        ("random, binary search", lambda: binary(u_random)),
+        ("random, uniform grid", lambda: interp(u_random)),
+        ("sorted, binary search", lambda: binary(u_sorted)),
+        ("sorted, uniform grid", lambda: interp(u_sorted)),
+        ("sorted, assume_sorted", lambda: interp(u_sorted, assume_sorted=True)),
+    ]
+    print(f"{args.size} queries on {args.knots} uniform knots (best of {args.repeat})")
+    for name, fn in cases:
+        print(f"  {name:<24} {best_of(fn, args.repeat):8.3f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Compares scalar __call__ with CoalescingEvaluator under concurrent callers.
+
+Usage: python benchmarks/bench_coalesce.py [--threads 64] [--tasks 1000]
+"""
+import argparse
+import asyncio
+import threading
+import time
+
+import numpy as np
+import pchips
+
+
+def run_threads(fn, threads, calls):
+    workers = [threading.Thread(target=lambda: [fn(float(i)) for i in range(calls)]) for _ in range(threads)]
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return threads * calls / (time.perf_counter() - start)
+
+
+async def run_tasks(evaluator, tasks, rounds):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        await asyncio.gather(*[evaluator.evaluate_async(float(i)) for i in range(tasks)])
+    return tasks * rounds / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--threads", type=int, default=64)
+    parser.add_argument("--calls", type=int, default=500)
+    parser.add_argument("--tasks", type=int, default=1000)
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--max-delay", type=float, default=200e-6)
+    args = parser.parse_args()
+
+    x = np.cumsum(np.random.default_rng(0).uniform(0.1, 1.0, 1000))
+    interp = pchips.PchipInterpolator(x, np.sin(x / 10))
+
+    print(f"Scalar requests per second ({args.threads} threads, {args.tasks} concurrent tasks)")
+    print(f"  {'threads, __call__':<28} {run_threads(interp, args.threads, args.calls):>10.0f}")
+    with pchips.CoalescingEvaluator(interp, max_delay=args.max_delay) as evaluator:
+        rate = run_threads(evaluator, args.threads, args.calls)
+        metrics = evaluator.metrics()
+    print(f"  {'threads, coalesced':<28} {rate:>10.0f}   mean batch {metrics['mean_batch_size']:.1f},"
+          f" p50 {metrics['latency_p50'] * 1e6:.0f} us, p99 {metrics['latency_p99'] * 1e6:.0f} us")
+    with pchips.CoalescingEvaluator(interp, max_delay=args.max_delay) as evaluator:
+        rate = asyncio.run(run_tasks(evaluator, args.tasks, args.rounds))
+        metrics = evaluator.metrics()
+    print(f"  {'asyncio tasks, coalesced':<28} {rate:>10.0f}   mean batch {metrics['mean_batch_size']:.1f},"
+          f" p50 {metrics['latency_p50'] * 1e6:.0f} us, p99 {metrics['latency_p99'] * 1e6:.0f} us")
+
+
+if __name__ == "__main__":
+    main()
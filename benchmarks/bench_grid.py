@@ -0,0 +1,50 @@
+"""
+Times PchipGridInterpolator against scipy's RegularGridInterpolator(method='cubic').
+
+Usage: python benchmarks/bench_grid.py [--shape 200 300] [--size 1000000]
+"""
+import argparse
+import time
+
+import numpy as np
+import scipy.interpolate
+import pchips
+
+
+def best_of(fn, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--shape", type=int, nargs='+', default=[200, 300])
+    parser.add_argument("--size", type=int, default=10**6)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    axes = [np.cumsum(rng.uniform(0.5, 1.5, n)) / n for n in args.shape]
+    mesh = np.meshgrid(*axes, indexing='ij')
+    values = np.exp(-mesh[0]) * np.prod([np.sin(3 * m) for m in mesh[1:]], axis=0)
+    u = np.column_stack([rng.uniform(a[0], a[-1], args.size) for a in axes])
+
+    ours = pchips.PchipGridInterpolator(axes, values)
+    theirs = scipy.interpolate.RegularGridInterpolator(axes, values, method='cubic')
+    cases = [
+        ("pchips fit", lambda: pchips.PchipGridInterpolator(axes, values)),
+        ("scipy cubic fit", lambda: scipy.interpolate.RegularGridInterpolator(axes, values, method='cubic')),
+        ("pchips evaluate", lambda: ours(u)),
+        ("scipy cubic evaluate", lambda: theirs(u)),
+    ]
+    print(f"{args.size} queries on a {'x'.join(map(str, args.shape))} grid (best of {args.repeat})")
+    for name, fn in cases:
+        print(f"  {name:<22} {best_of(fn, args.repeat):8.3f} s")
+
+
+if __name__ == "__main__":
+    main()
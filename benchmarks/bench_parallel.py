@@ -0,0 +1,55 @@
+"""
+Reports how threaded evaluation and process-pool batch fitting scale with workers.
+
+Usage: python benchmarks/bench_parallel.py [--size 10000000] [--curves 20000]
+"""
+import argparse
+import os
+import time
+
+import numpy as np
+import pchips
+
+
+def best_of(fn, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--size", type=int, default=10**7)
+    parser.add_argument("--curves", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    cores = os.cpu_count() or 1
+    counts = sorted({1, 2, 4, 8, 16, cores} & set(range(1, cores + 1)))
+    rng = np.random.default_rng(0)
+
+    x = np.cumsum(rng.uniform(0.1, 1.0, 1000))
+    interp = pchips.PchipInterpolator(x, np.sin(x / 10))
+    u = rng.uniform(x[0], x[-1], args.size)
+    out = np.empty_like(u)
+
+    lengths = rng.integers(5, 200, args.curves)
+    offsets = np.concatenate(([0], np.cumsum(lengths)))
+    xs = np.concatenate([np.cumsum(rng.uniform(0.1, 1.0, n)) for n in lengths])
+    ys = rng.normal(size=len(xs))
+
+    print(f"{cores} cores; best of {args.repeat}")
+    print(f"{'workers':>8} {'evaluate (s)':>13} {'speedup':>8} {'batch fit (s)':>14} {'speedup':>8}")
+    base = None
+    for workers in counts:
+        t_eval = best_of(lambda: interp(u, out=out, workers=workers), args.repeat)
+        t_fit = best_of(lambda: pchips.PchipBatch(xs, ys, offsets, workers=workers), args.repeat)
+        base = base or (t_eval, t_fit)
+        print(f"{workers:>8} {t_eval:>13.3f} {base[0] / t_eval:>8.2f} {t_fit:>14.3f} {base[1] / t_fit:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+"""
+Times construction and evaluation against scipy.interpolate.PchipInterpolator and writes JSON.
+
+Construction is timed for n = 10, 100, ..., --max-knots in all four configurations;
+evaluation on --knots knots for query sizes 100, ..., --max-queries drawn sorted,
+at random and out of range. Every case is run on the same data through SciPy's
+Fritsch-Butland interpolant as the baseline. The coefficient storage modes are
+compared, by memory and throughput, against the default float64 row layout on
+--storage-knots knots. Nothing is downloaded.
+
+Usage: python benchmarks/bench_suite.py [--output bench.json] [--max-knots 10000000]
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import timeit
+from importlib import metadata
+
+import numpy as np
+import scipy.interpolate
+import pchips
+
+CONFIGURATIONS = [
+    {'approx_order': 'cubic', 'mono_constraint': 'M4'},
+    {'approx_order': 'cubic', 'mono_constraint': 'M3'},
+    {'approx_order': 'quartic', 'mono_constraint': 'M4'},
+    {'approx_order': 'quartic', 'mono_constraint': 'M3'},
+]
+
+DISTRIBUTIONS = ["sorted", "random", "out_of_range"]
+
+STORAGE = [(np.float64, 'rows'), (np.float64, 'columns'), (np.float32, 'rows'), (np.float32, 'columns')]
+
+
+def best_of(fn, repeat):
+    """The best time per call, looping fast cases until each measurement takes 0.2 s."""
+    timer = timeit.Timer(fn)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def sizes(limit):
+    return [10**k for k in range(1, 16) if 10**k <= limit]
+
+
+def knots(n, rng):
+    x = np.cumsum(rng.uniform(0.1, 2.0, n))
+    y = np.cumsum(rng.normal(size=n))
+    return x, y
+
+
+def queries(x, size, distribution, rng):
+    if distribution == "sorted":
+        return np.linspace(x[0], x[-1], size)
+    if distribution == "random":
+        return rng.uniform(x[0], x[-1], size)
+    # Half below the first knot, half above the last.
+    width = x[-1] - x[0]
+    u = rng.uniform(0, width, size)
+    return np.where(np.arange(size) % 2, x[-1] + u, x[0] - u)
+
+
+def bench_construction(limit, repeat, rng):
+    results = []
+    for n in sizes(limit):
+        x, y = knots(n, rng)
+        baseline = best_of(lambda: scipy.interpolate.PchipInterpolator(x, y), repeat)
+        for config in CONFIGURATIONS:
+            elapsed = best_of(lambda: pchips.PchipInterpolator(x, y, **config), repeat)
+            results.append({'benchmark': 'construct', 'n': n, **config,
+                            'pchips_s': elapsed, 'scipy_s': baseline, 'ratio': elapsed / baseline})
+            print(f"  construct n={n:<9} {config['approx_order']:<8} {config['mono_constraint']}"
+                  f" {elapsed:10.6f} s  scipy {baseline:10.6f} s")
+    return results
+
+
+def bench_evaluation(n, limit, repeat, rng):
+    results = []
+    x, y = knots(n, rng)
+    interp = pchips.PchipInterpolator(x, y)
+    baseline_interp = scipy.interpolate.PchipInterpolator(x, y)
+    for size in sizes(limit)[1:]:
+        for distribution in DISTRIBUTIONS:
+            u = queries(x, size, distribution, rng)
+            cases = [('call', lambda: interp(u))]
+            if distribution == "sorted":
+                cases.append(('call_assume_sorted', lambda: interp(u, assume_sorted=True)))
+            baseline = best_of(lambda: baseline_interp(u), repeat)
+            for name, fn in cases:
+                elapsed = best_of(fn, repeat)
+                results.append({'benchmark': name, 'n': n, 'queries': size,
+                                'distribution': distribution, 'pchips_s': elapsed,
+                                'scipy_s': baseline, 'ratio': elapsed / baseline})
+                print(f"  {name:<18} q={size:<9} {distribution:<12}"
+                      f" {elapsed:10.6f} s  scipy {baseline:10.6f} s")
+    return results
+
+
+def bench_storage(n, size, repeat, rng):
+    results = []
+    x, y = knots(n, rng)
+    u = rng.uniform(x[0], x[-1], size)
+    baseline = None
+    for dtype, layout in STORAGE:
+        interp = pchips.PchipInterpolator(x, y, dtype=dtype, layout=layout)
+        for query_dtype in (np.float64, np.float32):
+            q = u.astype(query_dtype)
+            out = np.empty(size, dtype=query_dtype)
+            for name, fn in [('call', lambda: interp(q)), ('call_out', lambda: interp(q, out=out))]:
+                elapsed = best_of(fn, repeat)
+                if baseline is None:
+                    baseline = elapsed
+                results.append({'benchmark': f'storage_{name}', 'n': n, 'queries': size,
+                                'dtype': np.dtype(dtype).name, 'layout': layout,
+                                'query_dtype': np.dtype(query_dtype).name,
+                                'coeff_bytes': interp.coeffs.nbytes, 'pchips_s': elapsed,
+                                'speedup': baseline / elapsed})
+                print(f"  {name:<8} {np.dtype(dtype).name:<7} {layout:<7} queries {np.dtype(query_dtype).name:<7}"
+                      f" {interp.coeffs.nbytes / 2**20:8.1f} MiB {elapsed:10.6f} s  x{baseline / elapsed:.2f}")
+    return results
+
+
+def environment():
+    return {
+        'pchips': metadata.version('pchips'),
+        'numpy': np.__version__,
+        'scipy': scipy.__version__,
+        'python': sys.version.split()[0],
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'cpu_count': os.cpu_count(),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--output", default="bench.json")
+    parser.add_argument("--max-knots", type=int, default=10**7)
+    parser.add_argument("--knots", type=int, default=1000)
+    parser.add_argument("--max-queries", type=int, default=10**7)
+    parser.add_argument("--storage-knots", type=int, default=10**6)
+    parser.add_argument("--storage-queries", type=int, default=10**7)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    print(f"Construction, n up to {args.max_knots} (best of {args.repeat})")
+    results = bench_construction(args.max_knots, args.repeat, rng)
+    print(f"Evaluation on {args.knots} knots, up to {args.max_queries} queries")
+    results += bench_evaluation(args.knots, args.max_queries, args.repeat, rng)
+    print(f"Storage modes on {args.storage_knots} knots, {args.storage_queries} random queries,"
+          f" against float64 rows")
+    results += bench_storage(args.storage_knots, args.storage_queries, args.repeat, rng)
+
+    report = {'environment': environment(), 'parameters': vars(args), 'results': results}
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"Wrote {len(results)} results to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,6 @@
-from .interpolate import PchipInterpolator
+from .interpolate import PchipInterpolator, QueryPlan, PchipBatch, PchipGridInterpolator, FitProfile
+from .cache import InterpolatorCache, cached_interpolator, default_cache
+from .coalesce import CoalescingEvaluator
 
-__all__ = ["PchipInterpolator"]
\ No newline at end of file
+__all__ = ["PchipInterpolator", "QueryPlan", "PchipBatch", "PchipGridInterpolator", "FitProfile",
+           "InterpolatorCache", "cached_interpolator", "default_cache", "CoalescingEvaluator"]
\ No newline at end of file
@@ -0,0 +1,139 @@
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+
+import numpy as np
+
+from .interpolate import PchipInterpolator
+
+# Fitted tables kept by the default cache, in bytes.
+_DEFAULT_MAX_BYTES = 256 << 20
+
+
+class InterpolatorCache:
+    """
+    InterpolatorCache: fitted interpolants keyed by a hash of their data and configuration.
+
+    Entries are evicted least recently used first once their x, y and coefficient
+    arrays exceed `max_bytes`. The cache is thread-safe, and concurrent requests for
+    a key that is being fitted wait for that one fit instead of repeating it.
+
+    Attributes:
+        hits (int): Requests answered from the cache or by waiting on another caller's fit.
+        misses (int): Requests that fitted.
+        evictions (int): Entries dropped to stay within `max_bytes`.
+        nbytes (int): The bytes held by the cached entries.
+    """
+
+    def __init__(self, max_bytes=_DEFAULT_MAX_BYTES):
+        """
+        Initializes the cache.
+
+        Args:
+            max_bytes (int): The byte budget for the cached arrays. An interpolant
+                             larger than this is fitted but not kept.
+        """
+        if max_bytes < 0:
+            raise ValueError("max_bytes must be non-negative.")
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.nbytes = 0
+        self._entries = OrderedDict()
+        self._pending = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, x, y, approx_order='cubic', mono_constraint='M3', axis=0):
+        """
+        Returns the interpolant of (x, y), fitting it only if it is not cached.
+
+        The arguments are those of `PchipInterpolator`. The result shares the cached
+        arrays, which are read-only; `append` and `update` copy them first.
+        """
+        key = self._key(x, y, approx_order, mono_constraint, axis)
+        with self._lock:
+            interp = self._entries.get(key)
+            if interp is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._share(interp)
+            future = self._pending.get(key)
+            fitting = future is None
+            if fitting:
+                future = self._pending[key] = Future()
+                self.misses += 1
+            else:
+                self.hits += 1
+
+        if not fitting:
+            return self._share(future.result())
+        try:
+            interp = PchipInterpolator(x, y, approx_order=approx_order,
+                                       mono_constraint=mono_constraint, axis=axis)
+        except BaseException as error:
+            with self._lock:
+                del self._pending[key]
+            future.set_exception(error)
+            raise
+        for array in (interp.x, interp.y, interp.coeffs):
+            array.flags.writeable = False
+        with self._lock:
+            del self._pending[key]
+            self._store(key, interp)
+        future.set_result(interp)
+        return self._share(interp)
+
+    def clear(self):
+        """Drops every entry; the counters are kept."""
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = 0
+
+    def _key(self, x, y, approx_order, mono_constraint, axis):
+        if not isinstance(x, np.ndarray) or not isinstance(y, np.ndarray):
+            raise TypeError("x and y must be numpy arrays.")
+        digest = hashlib.blake2b(digest_size=16)
+        config = [approx_order, mono_constraint, int(axis)]
+        for array in (x, y):
+            config.append([array.dtype.str, array.shape])
+        digest.update(json.dumps(config).encode('utf-8'))
+        for array in (x, y):
+            digest.update(np.ascontiguousarray(array).data)
+        return digest.digest()
+
+    def _store(self, key, interp):
+        size = interp.x.nbytes + interp.y.nbytes + interp.coeffs.nbytes
+        if size > self.max_bytes:
+            return
+        self._entries[key] = interp
+        self.nbytes += size
+        while self.nbytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self.nbytes -= evicted.x.nbytes + evicted.y.nbytes + evicted.coeffs.nbytes
+            self.evictions += 1
+
+    def _share(self, interp):
+        """A new interpolant over the cached arrays, so callers can't disturb each other."""
+        return PchipInterpolator._from_fitted(interp.x, interp.y, interp.coeffs, interp.approx_order,
+                                              interp.mono_constraint, interp.axis)
+
+
+default_cache = InterpolatorCache()
+
+
+def cached_interpolator(x, y, approx_order='cubic', mono_constraint='M3', axis=0, cache=None):
+    """
+    Returns `PchipInterpolator(x, y, ...)`, reusing an earlier fit of the same data.
+
+    Args:
+        x, y, approx_order, mono_constraint, axis: As for `PchipInterpolator`.
+        cache (InterpolatorCache): The cache to use. Defaults to `pchips.default_cache`.
+    """
+    cache = default_cache if cache is None else cache
+    return cache.get(x, y, approx_order=approx_order, mono_constraint=mono_constraint, axis=axis)
@@ -0,0 +1,261 @@
+import asyncio
+import threading
+import time
+import weakref
+from collections import deque
+from concurrent.futures import Future
+
+import numpy as np
+
+_FLOAT64 = np.dtype(np.float64)
+
+
+class CoalescingEvaluator:
+    """
+    CoalescingEvaluator: evaluates many callers' small queries as one vectorized call.
+
+    Requests from any number of threads or event loops queue up; a dispatcher thread
+    takes everything that arrives within `max_delay` seconds of the first waiting
+    request, up to `max_batch` query points, evaluates it with one `interp(...)` call
+    and hands each caller its slice. This trades up to `max_delay` of latency per
+    request for a single NumPy dispatch per batch.
+
+    Results are those of `interp(u, nu=nu)` on float64 queries, cast to the query's
+    dtype when it is floating point. An evaluator dropped without `close` serves
+    what is queued and then stops its thread once it is garbage-collected.
+    """
+
+    def __init__(self, interp, max_batch=4096, max_delay=200e-6, nu=0, latency_samples=10000):
+        """
+        Initializes the evaluator and starts its dispatcher thread.
+
+        Args:
+            interp (PchipInterpolator): The interpolant to evaluate.
+            max_batch (int): Dispatch once this many query points are waiting. A single
+                             larger request is dispatched on its own.
+            max_delay (float): Seconds to wait for more requests after the first one
+                               arrives. 0 dispatches whatever is waiting straight away.
+            nu (int): The order of the derivative to evaluate. Default is 0.
+            latency_samples (int): How many recent request latencies `metrics` summarizes.
+        """
+        if int(max_batch) < 1:
+            raise ValueError("max_batch must be positive.")
+        if not max_delay >= 0:
+            raise ValueError("max_delay must be non-negative.")
+        self.interp = interp
+        self.max_batch = int(max_batch)
+        self.max_delay = float(max_delay)
+        self.nu = nu
+        self._queue = deque()
+        self._waiting = 0
+        self._closed = False
+        self._wakeup = threading.Condition()
+        self._requests = 0
+        self._queries = 0
+        self._batches = 0
+        self._max_batch_seen = 0
+        self._latencies = deque(maxlen=latency_samples)
+        # The dispatcher holds the evaluator only through this, while requests are queued.
+        self._keepalive = [None]
+        self._thread = threading.Thread(target=_dispatch, args=(weakref.ref(self), self._wakeup, self._keepalive),
+                                        name="CoalescingEvaluator", daemon=True)
+        self._thread.start()
+        weakref.finalize(self, _wake, self._wakeup)
+
+    def submit(self, u):
+        """
+        Queues a query for the next batch.
+
+        Args:
+            u (float or np.ndarray): The query points.
+
+        Returns:
+            concurrent.futures.Future: Resolves to what `interp(u)` would return.
+        """
+        future = Future()
+        self._enqueue(u, future)
+        return future
+
+    def __call__(self, u):
+        """Evaluates u in the next batch, blocking until its result is ready."""
+        return self.submit(u).result()
+
+    async def evaluate_async(self, u):
+        """Evaluates u in the next batch without blocking the running event loop."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._enqueue(u, (loop, future))
+        return await future
+
+    def _enqueue(self, u, waiter):
+        # A request is (values, size, shape, is_scalar, result dtype, waiter, submitted).
+        if isinstance(u, (float, int)):
+            # Python scalars, the common case, skip NumPy until the whole batch is built.
+            request = (float(u), 1, (), True, _FLOAT64, waiter, time.perf_counter())
+        else:
+            is_scalar = not isinstance(u, np.ndarray)
+            u = np.asarray(u)
+            result_dtype = u.dtype if u.dtype.kind == 'f' else _FLOAT64
+            flat = u.astype(np.float64, copy=False).reshape(-1)
+            request = (flat, len(flat), u.shape, is_scalar, result_dtype, waiter, time.perf_counter())
+        with self._wakeup:
+            if self._closed:
+                raise RuntimeError("The evaluator is closed.")
+            self._queue.append(request)
+            self._waiting += request[1]
+            self._keepalive[0] = self
+            # The dispatcher only needs waking to start a window or to cut one short.
+            if len(self._queue) == 1 or self._waiting >= self.max_batch:
+                self._wakeup.notify()
+
+    def metrics(self):
+        """
+        Summarizes the requests served so far.
+
+        Returns:
+            dict: Counts of 'requests', 'queries' and 'batches'; the 'mean_batch_size'
+                  and 'max_batch_size' in query points; and the 'latency_p50',
+                  'latency_p99' and 'latency_max' in seconds, from submission to result,
+                  over the most recent requests.
+        """
+        with self._wakeup:
+            latencies = np.array(self._latencies)
+            metrics = {'requests': self._requests, 'queries': self._queries, 'batches': self._batches,
+                       'mean_batch_size': self._queries / self._batches if self._batches else 0.0,
+                       'max_batch_size': self._max_batch_seen}
+        for name, q in (('latency_p50', 50), ('latency_p99', 99), ('latency_max', 100)):
+            metrics[name] = float(np.percentile(latencies, q)) if len(latencies) else 0.0
+        return metrics
+
+    def close(self):
+        """Serves the requests already queued, then stops the dispatcher thread."""
+        with self._wakeup:
+            self._closed = True
+            self._wakeup.notify()
+        self._thread.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _serve(self):
+        """Waits out the window of the first queued request and serves one batch."""
+        with self._wakeup:
+            deadline = self._queue[0][-1] + self.max_delay
+            while self._waiting < self.max_batch and not self._closed:
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    break
+                self._wakeup.wait(remaining)
+            batch = [self._queue.popleft()]
+            size = batch[0][1]
+            while self._queue and size + self._queue[0][1] <= self.max_batch:
+                batch.append(self._queue.popleft())
+                size += batch[-1][1]
+            self._waiting -= size
+            if not self._queue:
+                self._keepalive[0] = None
+        # Drop requests cancelled while queued; the rest can no longer be cancelled.
+        batch = [request for request in batch if _claim(request[5])]
+        if not batch:
+            return
+        try:
+            self._evaluate(batch, sum(request[1] for request in batch))
+        except BaseException as error:
+            # Keep the dispatcher alive for later requests whatever went wrong.
+            self._resolve([(request[5], None) for request in batch], error)
+
+    def _evaluate(self, batch, size):
+        values = [request[0] for request in batch]
+        all_scalars = size == len(batch) and all(type(v) is float for v in values)
+        try:
+            if all_scalars:
+                u = np.array(values)
+            else:
+                u = np.concatenate([np.array([v]) if type(v) is float else v for v in values])
+            values = self.interp(u, nu=self.nu)
+        except BaseException as error:
+            self._resolve([(request[5], None) for request in batch], error)
+            return
+        done = time.perf_counter()
+        with self._wakeup:
+            self._requests += len(batch)
+            self._queries += size
+            self._batches += 1
+            self._max_batch_seen = max(self._max_batch_seen, size)
+            self._latencies.extend(done - request[-1] for request in batch)
+
+        if all_scalars and values.ndim == 1:
+            self._resolve(zip([request[5] for request in batch], values))
+            return
+        # The query axis sits at interp.axis in the result; split and reshape along it.
+        axis = self.interp.axis
+        trailing = values.shape[:axis], values.shape[axis + 1:]
+        bounds = np.cumsum([request[1] for request in batch])[:-1]
+        results = []
+        for (_, _, shape, is_scalar, dtype, waiter, _), part in zip(batch, np.split(values, bounds, axis=axis)):
+            result = part.reshape(trailing[0] + shape + trailing[1]).astype(dtype, copy=False)
+            results.append((waiter, result[()] if is_scalar else result))
+        self._resolve(results)
+
+    def _resolve(self, results, error=None):
+        """Completes the waiters; asyncio ones with one thread-safe callback per event loop."""
+        loops = {}
+        for waiter, result in results:
+            if isinstance(waiter, Future):
+                if waiter.done():
+                    continue
+                if error is None:
+                    waiter.set_result(result)
+                else:
+                    waiter.set_exception(error)
+            else:
+                loops.setdefault(waiter[0], []).append((waiter[1], result))
+        for loop, pending in loops.items():
+            try:
+                loop.call_soon_threadsafe(_set_async_results, pending, error)
+            except RuntimeError:
+                # The loop was closed while its requests were in flight.
+                pass
+
+
+def _dispatch(ref, wakeup, keepalive):
+    """The dispatcher thread, which stops once its evaluator is closed or collected."""
+    while True:
+        with wakeup:
+            while keepalive[0] is None:
+                evaluator = ref()
+                closed = evaluator is None or evaluator._closed
+                # Hold no reference while idle, so the evaluator can be collected. If
+                # ours was the last one, its finalizer has already run, so look again.
+                del evaluator
+                if closed or ref() is None:
+                    return
+                wakeup.wait()
+            evaluator = keepalive[0]
+        evaluator._serve()
+        del evaluator
+
+
+def _wake(wakeup):
+    with wakeup:
+        wakeup.notify()
+
+
+def _claim(waiter):
+    """Whether a queued waiter still wants its result, marking a Future as running."""
+    if isinstance(waiter, Future):
+        return waiter.set_running_or_notify_cancel()
+    return not waiter[1].cancelled()
+
+
+def _set_async_results(pending, error):
+    for future, result in pending:
+        if future.done():
+            continue
+        if error is None:
+            future.set_result(result)
+        else:
+            future.set_exception(error)
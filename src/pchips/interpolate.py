@@ -1,61 +1,239 @@
+import json
+import struct
+import time
+import tracemalloc
+import weakref
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
+from functools import cached_property
+from multiprocessing import shared_memory
+
 import numpy as np
 
-class PchipInterpolator:
+# Queries per block in chunked evaluation; the scratch buffers stay in cache.
+_CHUNK_SIZE = 1 << 16
+# Bytes of gathered cell coefficients per block in PchipGridInterpolator.__call__.
+_GRID_CHUNK_BYTES = 1 << 19
+
+# Huynh's stencils reach at most this many knots either side of a coefficient row,
+# so refitting a window this much wider than the changed rows reproduces a full fit.
+_REFIT_MARGIN = 8
+
+# On-disk format: magic, little-endian uint64 header length, JSON header, then
+# the arrays, each C-ordered, little-endian and aligned to _FILE_ALIGNMENT bytes.
+_FILE_MAGIC = b'\x93PCHIPS\n'
+_FILE_VERSION = 1
+_FILE_ALIGNMENT = 64
+
+
+def _save_fitted(path, kind, config, arrays):
+    """Writes a fitted interpolant's configuration and arrays to path."""
+    entries = []
+    offset = 0
+    for name, array in arrays.items():
+        array = np.asarray(array)
+        offset = -(-offset // _FILE_ALIGNMENT) * _FILE_ALIGNMENT
+        entries.append({'name': name, 'dtype': array.dtype.newbyteorder('<').str,
+                        'shape': list(array.shape), 'offset': offset})
+        offset += array.nbytes
+    header = json.dumps({'version': _FILE_VERSION, 'kind': kind, 'config': config,
+                         'arrays': entries}).encode('utf-8')
+    # Array offsets in the header are relative to the aligned end of the header.
+    start = -(-(len(_FILE_MAGIC) + 8 + len(header)) // _FILE_ALIGNMENT) * _FILE_ALIGNMENT
+    with open(path, 'wb') as f:
+        f.write(_FILE_MAGIC)
+        f.write(struct.pack('<Q', len(header)))
+        f.write(header)
+        for entry, array in zip(entries, arrays.values()):
+            f.write(b'\0' * (start + entry['offset'] - f.tell()))
+            f.write(np.ascontiguousarray(array, dtype=entry['dtype']).tobytes())
+
+
+def _load_fitted(path, kind, mmap):
+    """Reads what `_save_fitted` wrote; arrays are read-only memory maps if mmap is True."""
+    with open(path, 'rb') as f:
+        if f.read(len(_FILE_MAGIC)) != _FILE_MAGIC:
+            raise ValueError(f"{path} is not a saved pchips interpolant.")
+        (length,) = struct.unpack('<Q', f.read(8))
+        header = json.loads(f.read(length).decode('utf-8'))
+    if header.get('version') != _FILE_VERSION:
+        raise ValueError(f"Unsupported file format version: {header.get('version')}")
+    if header.get('kind') != kind:
+        raise ValueError(f"{path} holds a {header.get('kind')}, not a {kind}.")
+    start = -(-(len(_FILE_MAGIC) + 8 + length) // _FILE_ALIGNMENT) * _FILE_ALIGNMENT
+    arrays = {}
+    for entry in header['arrays']:
+        dtype, shape = np.dtype(entry['dtype']), tuple(entry['shape'])
+        if mmap:
+            # np.asarray drops the memmap subclass but keeps the read-only mapping.
+            arrays[entry['name']] = np.asarray(np.memmap(path, dtype=dtype, mode='r', shape=shape,
+                                                         offset=start + entry['offset']))
+        else:
+            arrays[entry['name']] = np.fromfile(path, dtype=dtype, count=int(np.prod(shape)),
+                                                offset=start + entry['offset']).reshape(shape)
+    return header['config'], arrays
+
+
+def _grid_step(x):
+    """Returns the step of a uniform grid if x is within a quarter step of one, else None."""
+    step = (x[-1] - x[0]) / (len(x) - 1)
+    grid = x[0] + step * np.arange(len(x))
+    return step if np.all(np.abs(x - grid) <= 0.25 * step) else None
+
+
+def _store_table(table, dtype, layout):
+    """Returns a coefficient table in the given storage dtype and layout, copying only if needed."""
+    if np.dtype(dtype) not in (np.float64, np.float32):
+        raise ValueError(f"Unsupported dtype: {dtype}")
+    if layout == 'rows':
+        return np.ascontiguousarray(table, dtype=dtype)
+    if layout == 'columns':
+        # Each power's column is contiguous; the (n-1, 4) view on top is unchanged.
+        return np.moveaxis(np.ascontiguousarray(np.moveaxis(table, 1, 0), dtype=dtype), 0, 1)
+    raise ValueError(f"Unsupported layout: {layout}")
+
+
+def _compute_dtypes(table, u):
+    """The dtype to evaluate in, and the dtype to return: that of floating-point queries."""
+    if np.issubdtype(u.dtype, np.floating):
+        return np.result_type(table.dtype, u.dtype), u.dtype
+    compute = np.result_type(table.dtype, np.float64)
+    return compute, compute
+
+
+def _locate(x, u, step=None, assume_sorted=False):
+    """Finds the interval index of each query, extrapolating from the end intervals."""
+    n = len(x)
+    if assume_sorted:
+        # Merge the knots into the sorted queries: the interval of query j is
+        # the number of knots <= u[j], less one. Only the knots between the
+        # first and last query need merging; lo knots lie at or below them all.
+        flat = u.ravel()
+        if not len(flat):
+            return np.zeros(u.shape, dtype=np.intp)
+        lo, hi = np.searchsorted(x, flat[[0, -1]], side='right')
+        starts = np.searchsorted(flat, x[lo:hi], side='left')
+        indices = lo - 1 + np.cumsum(np.bincount(starts, minlength=len(flat) + 1)[:len(flat)])
+        indices = indices.reshape(u.shape)
+    elif step is not None:
+        # The grid guess is off by at most one interval; fix it up against the knots.
+        t = np.fmax(np.fmin((u - x[0]) / step, n - 2), 0)
+        indices = t.astype(np.intp)
+        indices -= u < x[indices]
+        indices += u >= x[indices + 1]
+    else:
+        indices = np.searchsorted(x, u, side='right') - 1
+    return np.clip(indices, 0, n - 2)
+
+
+class FitProfile:
     """
-    PchipInterpolator: H.T. Huynh's accurate monotone cubic interpolant.
+    FitProfile: what `PchipInterpolator(..., profile=True)` recorded about its fit.
 
-    This class mimics the behavior of `scipy.interpolate.PchipInterpolator`
-    but uses H.T. Huyn's algorithm instead of F. N. Fritsch and J. Butland's.
+    Attributes:
+        stages (dict): For each constructor stage ('validate', 'vecdiffs', 'approxder',
+                       'perturbder', 'compute_coeffs'), a dict of its wall time in
+                       'seconds', the bytes it left 'allocated' and its 'peak' bytes
+                       above the level it started at, as traced by tracemalloc. The
+                       peak is None when tracemalloc was already tracing, as it can't
+                       be measured without resetting the caller's peak.
+        calls (list): For each `__call__`, a dict of its 'seconds' and number of 'queries'.
+        clipped (dict): For the mono_constraint branch used, the number of derivative
+                        estimates the perturbation changed at 'boundary' knots (those
+                        given one-sided bounds) and at 'interior' knots.
+        estimates (dict): The number of derivative estimates at 'boundary' and 'interior' knots.
     """
 
-    def __init__(self, x, y, approx_order='cubic', mono_constraint='M3'):
-        """
-        Initializes the interpolator.
+    def __init__(self):
+        self.stages = {}
+        self.calls = []
+        self.clipped = {}
+        self.estimates = {}
 
-        Args:
-            x (np.ndarray): The knot vector.
-            y (np.ndarray): The data vector.
-            approx_order (str): The order of the derivative approximation formula.
-                                Supported: 'cubic' (default), 'quartic'.
-            mono_constraint (str): The monotonicity constraint type.
-                                   Supported: 'M3' (default), 'M4'.
-        """
-        if not isinstance(x, np.ndarray) or not isinstance(y, np.ndarray):
-            raise TypeError("x and y must be numpy arrays.")
-        if x.ndim != 1 or y.ndim != 1:
-            raise ValueError("x and y must be 1-dimensional.")
-        if x.shape != y.shape:
-            raise ValueError("x and y must have the same shape.")
-        if x.shape[0] < 5:
-            raise ValueError("There should be at least five data points.")
-        if not np.all(np.isfinite(x)) or not np.all(np.isfinite(y)):
-            raise ValueError("x and y must contain finite values.")
+    @contextmanager
+    def stage(self, name):
+        """Times the enclosed block and traces its allocations as stage `name`."""
+        started = not tracemalloc.is_tracing()
+        if started:
+            tracemalloc.start()
+        try:
+            # A fresh start also starts a fresh peak.
+            before = tracemalloc.get_traced_memory()[0]
+            start = time.perf_counter()
+            yield
+            seconds = time.perf_counter() - start
+            current, peak = tracemalloc.get_traced_memory()
+            self.stages[name] = {'seconds': seconds, 'allocated': current - before,
+                                 'peak': peak - before if started else None}
+        finally:
+            if started:
+                tracemalloc.stop()
 
-        self.approx_order = approx_order
-        self.mono_constraint = mono_constraint
+    def _count_clipped(self, fit, d, dper):
+        """Tallies the estimates the perturbation changed, by boundary and interior knot."""
+        a, b = fit._starts, fit._ends
+        reach = [a, a+1, b-2, b-1]
+        if fit.mono_constraint == 'M4':
+            reach += [a+2, b-3]
+        boundary = np.zeros(fit.n, dtype=bool)
+        boundary[np.concatenate(reach)] = True
+        changed = (dper != d).reshape(fit.n, -1)
+        per_knot = changed.shape[1]
+        self.clipped[fit.mono_constraint] = {'boundary': int(changed[boundary].sum()),
+                                             'interior': int(changed[~boundary].sum())}
+        self.estimates = {'boundary': int(boundary.sum()) * per_knot,
+                          'interior': int((~boundary).sum()) * per_knot}
 
-        # Sort x and y
-        idx = np.argsort(x)
-        self.x = x[idx]
-        self.y = y[idx]
-        
-        h = np.diff(self.x)
-        if np.any(h <= 0):
-            raise ValueError("The data abscissae should be distinct and increasing.")
+    def __repr__(self):
+        stages = ', '.join(f"{name}={stage['seconds']:.3g}s" for name, stage in self.stages.items())
+        return f"FitProfile({stages}, clipped={self.clipped}, calls={len(self.calls)})"
 
-        self.n = len(self.x)
-        
-        d = self._approxder()
-        d = self._perturbder(d)
-        self._compute_coeffs(d)
+
+class _HuynhFit:
+    """
+    Huynh's derivative estimation and perturbation over one or more knot segments.
+
+    Subclasses set `x`, `y` (knots along axis 0), `n`, `approx_order` and
+    `mono_constraint`, plus `_starts`/`_ends`: the knot index ranges of the
+    independent curves laid end to end in `x` and `y`. Stencils that straddle
+    two segments produce throwaway values that the one-sided end formulas
+    overwrite. A `profile` set to a FitProfile records each stage of the fit.
+    """
+
+    profile = None
+
+    def _fit(self):
+        with self._stage('vecdiffs'):
+            s, ds, e, f = self._vecdiffs()
+        with self._stage('approxder'):
+            d = self._approxder(s, ds, e, f)
+        with self._stage('perturbder'):
+            dper = self._perturbder(d, s, ds, e)
+        if self.profile is not None:
+            self.profile._count_clipped(self, d, dper)
+        with self._stage('compute_coeffs'):
+            self._compute_coeffs(dper)
+
+    def _stage(self, name):
+        return nullcontext() if self.profile is None else self.profile.stage(name)
+
+    def _knot_derivatives(self):
+        """The perturbed derivative estimates at every knot, without the coefficients."""
+        s, ds, e, f = self._vecdiffs()
+        d = self._approxder(s, ds, e, f)
+        return self._perturbder(d, s, ds, e)
+
+    def _bcast(self, a):
+        """Appends axes to a knot-indexed array so it broadcasts against y."""
+        return a.reshape(a.shape + (1,) * (self.y.ndim - 1))
 
     def _vecdiffs(self):
         y_temp = self.y.copy()
-        diffs = np.zeros((4, self.n - 1))
+        diffs = np.zeros((4, self.n - 1) + self.y.shape[1:])
         for i in range(4):
             if i > 0:
                 y_temp = diffs[i-1, :self.n-i]
-            h = self.x[i+1:] - self.x[:-(i+1)]
+            h = self._bcast(self.x[i+1:] - self.x[:-(i+1)])
             diffs[i, :self.n-1-i] = (y_temp[1:self.n-i] - y_temp[:self.n-1-i]) / h
 
         s = diffs[0, :]
@@ -64,38 +242,48 @@ class PchipInterpolator:
         f = diffs[3, :self.n-4]
         return s, ds, e, f
 
-    def _approxder(self):
-        d = np.zeros(self.n)
-        s, ds, e, f = self._vecdiffs()
+    def _approxder(self, s, ds, e, f):
+        n = self.n
+        x = self._bcast(self.x)
+        d = np.zeros(self.y.shape)
 
         if self.approx_order == 'cubic':
-            for k in range(self.n - 3):
-                d[k] = s[k] + ds[k]*(self.x[k] - self.x[k+1]) + \
-                       e[k]*(self.x[k]**2 + self.x[k+1]*self.x[k+2] - self.x[k]*self.x[k+1] - self.x[k]*self.x[k+2])
-            w1 = 3*e[self.n-4]
-            w2 = 2*(ds[self.n-4] - e[self.n-4]*(self.x[self.n-4] + self.x[self.n-3] + self.x[self.n-2]))
-            rest = s[self.n-4] - ds[self.n-4]*(self.x[self.n-4] + self.x[self.n-3]) + \
-                   e[self.n-4]*(self.x[self.n-4]*self.x[self.n-3] + self.x[self.n-4]*self.x[self.n-2] + self.x[self.n-3]*self.x[self.n-2])
-            for k in range(self.n - 3, self.n):
-                 d[k] = w1*self.x[k]**2 + w2*self.x[k] + rest
+            # x0, x1, x2 are the stencil x[k], x[k+1], x[k+2] for every interior k.
+            # np.float_power goes through the C library pow() like scalar **, whereas
+            # the ndarray ** fast paths round differently and the formula amplifies that.
+            x0, x1, x2 = x[:n-3], x[1:n-2], x[2:n-1]
+            d[:n-3] = s[:n-3] + ds[:n-3]*(x0 - x1) + \
+                      e[:n-3]*(np.float_power(x0, 2) + x1*x2 - x0*x1 - x0*x2)
+            # The one-sided formulas at the end of each segment are fitted at j = end - 4.
+            j = self._ends - 4
+            w1 = 3*e[j]
+            w2 = 2*(ds[j] - e[j]*(x[j] + x[j+1] + x[j+2]))
+            rest = s[j] - ds[j]*(x[j] + x[j+1]) + \
+                   e[j]*(x[j]*x[j+1] + x[j]*x[j+2] + x[j+1]*x[j+2])
+            tail = self._ends[:, None] - np.arange(3, 0, -1)
+            xt = x[tail]
+            d[tail] = w1[:, None]*np.float_power(xt, 2) + w2[:, None]*xt + rest[:, None]
         elif self.approx_order == 'quartic':
-            for k in range(self.n - 4):
-                d[k] = s[k] + ds[k]*(self.x[k] - self.x[k+1]) + \
-                       e[k]*(self.x[k]*(self.x[k] - self.x[k+1] - self.x[k+2]) + self.x[k+1]*self.x[k+2]) + \
-                       f[k]*(self.x[k]**2*(self.x[k] - self.x[k+1] - self.x[k+2] - self.x[k+3]) + \
-                             self.x[k]*(self.x[k+1]*self.x[k+2] + self.x[k+1]*self.x[k+3] + self.x[k+2]*self.x[k+3]) - \
-                             self.x[k+1]*self.x[k+2]*self.x[k+3])
-            w1 = 4*f[self.n-5]
-            w2 = 3*(e[self.n-5] - f[self.n-5]*(self.x[self.n-5] + self.x[self.n-4] + self.x[self.n-3] + self.x[self.n-2]))
-            w3 = 2*(ds[self.n-5] - e[self.n-5]*(self.x[self.n-5] + self.x[self.n-4] + self.x[self.n-3]) + \
-                    f[self.n-5]*(self.x[self.n-5]*(self.x[self.n-4] + self.x[self.n-3] + self.x[self.n-2]) + \
-                    self.x[self.n-4]*self.x[self.n-3] + self.x[self.n-4]*self.x[self.n-2] + self.x[self.n-3]*self.x[self.n-2]))
-            rest = s[self.n-5] - ds[self.n-5]*(self.x[self.n-5] + self.x[self.n-4]) + \
-                   e[self.n-5]*(self.x[self.n-5]*self.x[self.n-4] + self.x[self.n-5]*self.x[self.n-3] + self.x[self.n-4]*self.x[self.n-3]) - \
-                   f[self.n-5]*(self.x[self.n-4]*self.x[self.n-3]*self.x[self.n-2] + \
-                           self.x[self.n-5]*(self.x[self.n-4]*self.x[self.n-3] + self.x[self.n-4]*self.x[self.n-2] + self.x[self.n-3]*self.x[self.n-2]))
-            for k in range(self.n - 4, self.n):
-                d[k] = w1*self.x[k]**3 + w2*self.x[k]**2 + w3*self.x[k] + rest
+            x0, x1, x2, x3 = x[:n-4], x[1:n-3], x[2:n-2], x[3:n-1]
+            d[:n-4] = s[:n-4] + ds[:n-4]*(x0 - x1) + \
+                      e[:n-4]*(x0*(x0 - x1 - x2) + x1*x2) + \
+                      f[:n-4]*(np.float_power(x0, 2)*(x0 - x1 - x2 - x3) + \
+                               x0*(x1*x2 + x1*x3 + x2*x3) - \
+                               x1*x2*x3)
+            j = self._ends - 5
+            w1 = 4*f[j]
+            w2 = 3*(e[j] - f[j]*(x[j] + x[j+1] + x[j+2] + x[j+3]))
+            w3 = 2*(ds[j] - e[j]*(x[j] + x[j+1] + x[j+2]) + \
+                    f[j]*(x[j]*(x[j+1] + x[j+2] + x[j+3]) + \
+                    x[j+1]*x[j+2] + x[j+1]*x[j+3] + x[j+2]*x[j+3]))
+            rest = s[j] - ds[j]*(x[j] + x[j+1]) + \
+                   e[j]*(x[j]*x[j+1] + x[j]*x[j+2] + x[j+1]*x[j+2]) - \
+                   f[j]*(x[j+1]*x[j+2]*x[j+3] + \
+                         x[j]*(x[j+1]*x[j+2] + x[j+1]*x[j+3] + x[j+2]*x[j+3]))
+            tail = self._ends[:, None] - np.arange(4, 0, -1)
+            xt = x[tail]
+            d[tail] = w1[:, None]*np.float_power(xt, 3) + w2[:, None]*np.float_power(xt, 2) + \
+                      w3[:, None]*xt + rest[:, None]
         else:
             raise ValueError(f"Unsupported approx_order: {self.approx_order}")
         return d
@@ -103,60 +291,64 @@ class PchipInterpolator:
     def _minmod(self, a, b):
         return (np.sign(a) + np.sign(b)) / 2 * np.minimum(np.abs(a), np.abs(b))
 
-    def _perturbder(self, d):
+    def _perturbder(self, d, s, ds, e):
         nder = 3
+        n = self.n
+        x = self._bcast(self.x)
         dper = d.copy()
-        s, ds, e, f = self._vecdiffs()
-        h = np.diff(self.x)
-        smin = np.array([self._minmod(s[k], s[k+1]) for k in range(self.n - 2)])
-        dmin = np.array([self._minmod(ds[k], ds[k+1]) for k in range(self.n - 3)])
+        h = np.diff(x, axis=0)
+        smin = self._minmod(s[:-1], s[1:])
+        dmin = self._minmod(ds[:-1], ds[1:])
 
+        if self.mono_constraint not in ('M3', 'M4'):
+            raise ValueError(f"Unsupported mono_constraint: {self.mono_constraint}")
+
+        # M3 bound for k = 2, ..., n-3.
+        xk = x[2:n-2]
+        p1 = s[1:n-3] + dmin[:n-4]*(xk - x[1:n-3])
+        p2 = s[2:n-2] + dmin[1:n-3]*(xk - x[3:n-1])
+        t = self._minmod(p1, p2)
+        tmax = np.sign(t) * np.maximum(nder * np.abs(smin[1:n-3]), (nder / 2) * np.abs(t))
+
+        # The interior bounds above are evaluated at every knot of the flat array;
+        # knots within reach of a segment end get their one-sided bounds below.
+        a, b = self._starts, self._ends
         if self.mono_constraint == 'M3':
-            dper[0] = self._minmod(d[0], nder * s[0])
-            dper[self.n-1] = self._minmod(d[self.n-1], nder * s[self.n-2])
-            dper[1] = self._minmod(d[1], nder * self._minmod(s[0], s[1]))
-            dper[self.n-2] = self._minmod(d[self.n-2], nder*self._minmod(s[self.n-3], s[self.n-2]))
-            for k in range(2, self.n - 2):
-                p1 = s[k-1] + dmin[k-2]*(self.x[k] - self.x[k-1])
-                p2 = s[k]   + dmin[k-1]*(self.x[k] - self.x[k+1])
-                t = self._minmod(p1, p2)
-                tmax = np.sign(t) * np.maximum(nder * np.abs(smin[k-1]), (nder / 2) * np.abs(t))
-                dper[k] = self._minmod(d[k], tmax)
-        elif self.mono_constraint == 'M4':
-            emin = np.array([self._minmod(e[k], e[k+1]) for k in range(self.n - 4)])
-            dper[0] = self._minmod(d[0], nder * s[0])
-            dper[self.n-1] = self._minmod(d[self.n-1], nder * s[self.n-2])
-            dper[1] = np.sign(d[1]) * np.minimum(np.abs(d[1]), nder * np.abs(s[0]))
-            dper[1] = np.sign(dper[1]) * np.minimum(np.abs(dper[1]), nder * np.abs(s[1]))
-            dper[self.n-2] = np.sign(d[self.n-2]) * np.minimum(np.abs(d[self.n-2]), nder*np.abs(s[self.n-3]))
-            dper[self.n-2] = np.sign(dper[self.n-2]) * np.minimum(np.abs(dper[self.n-2]), nder*np.abs(s[self.n-2]))
-            t = self._minmod(s[1] + dmin[0]*(self.x[2] - self.x[1]), s[2] + dmin[1]*(self.x[2] - self.x[3]))
-            tmax = np.sign(t)*max(nder*abs(smin[1]), (nder/2)*abs(t))
-            dper[2] = self._minmod(d[2], tmax)
-            t = self._minmod(s[self.n-4] + dmin[self.n-5]*(self.x[self.n-3] - self.x[self.n-4]), s[self.n-3] + dmin[self.n-4]*(self.x[self.n-3] - self.x[self.n-2]))
-            tmax = np.sign(t)*max(nder*abs(smin[self.n-4]), (nder/2)*abs(t))
-            dper[self.n-3] = self._minmod(d[self.n-3], tmax)
-            for k in range(3, self.n - 3):
-                p1 = s[k-1] + dmin[k-2]*(self.x[k] - self.x[k-1])
-                p2 = s[k]   + dmin[k-1]*(self.x[k] - self.x[k+1])
-                q1 = s[k-1] - h[k-1]*self._minmod(ds[k-2] + emin[k-3]*(self.x[k-1] - self.x[k-2]),
-                                            ds[k-1] + emin[k-2]*(self.x[k-1] - self.x[k+1]))
-                q2 = s[k]   - h[k]  *self._minmod(ds[k-1] + emin[k-2]*(self.x[k]   - self.x[k-1]),
-                                            ds[k]   + emin[k-1]*(self.x[k]   - self.x[k+2]))
-                t  = self._minmod(p1,p2)
-                tt = self._minmod(q1,q2)
-                vec = np.array([0, nder*smin[k-1], (nder/2)*t, tt])
-                min_vec = np.min(vec)
-                max_vec = np.max(vec)
-                dper[k] = d[k] + self._minmod(min_vec - d[k], max_vec - d[k])
+            dper[2:n-2] = self._minmod(d[2:n-2], tmax)
+            dper[a] = self._minmod(d[a], nder * s[a])
+            dper[b-1] = self._minmod(d[b-1], nder * s[b-2])
+            dper[a+1] = self._minmod(d[a+1], nder * self._minmod(s[a], s[a+1]))
+            dper[b-2] = self._minmod(d[b-2], nder*self._minmod(s[b-3], s[b-2]))
         else:
-            raise ValueError(f"Unsupported mono_constraint: {self.mono_constraint}")
+            # M4 bound for k = 3, ..., n-4; t[1:-1] is the M3 minmod at those knots.
+            emin = self._minmod(e[:-1], e[1:])
+            k = slice(3, n-3)
+            xk = x[k]
+            xm1 = x[2:n-4]
+            q1 = s[2:n-4] - h[2:n-4]*self._minmod(ds[1:n-5] + emin[:n-6]*(xm1 - x[1:n-5]),
+                                                  ds[2:n-4] + emin[1:n-5]*(xm1 - x[4:n-2]))
+            q2 = s[k]     - h[k]    *self._minmod(ds[2:n-4] + emin[1:n-5]*(xk - xm1),
+                                                  ds[k]     + emin[2:n-4]*(xk - x[5:n-1]))
+            tt = self._minmod(q1, q2)
+            vec = np.stack([np.zeros_like(tt), nder*smin[2:n-4], (nder/2)*t[1:-1], tt])
+            min_vec = np.min(vec, axis=0)
+            max_vec = np.max(vec, axis=0)
+            dper[k] = d[k] + self._minmod(min_vec - d[k], max_vec - d[k])
+
+            dper[a] = self._minmod(d[a], nder * s[a])
+            dper[b-1] = self._minmod(d[b-1], nder * s[b-2])
+            dper[a+1] = np.sign(d[a+1]) * np.minimum(np.abs(d[a+1]), nder * np.abs(s[a]))
+            dper[a+1] = np.sign(dper[a+1]) * np.minimum(np.abs(dper[a+1]), nder * np.abs(s[a+1]))
+            dper[b-2] = np.sign(d[b-2]) * np.minimum(np.abs(d[b-2]), nder*np.abs(s[b-3]))
+            dper[b-2] = np.sign(dper[b-2]) * np.minimum(np.abs(dper[b-2]), nder*np.abs(s[b-2]))
+            dper[a+2] = self._minmod(d[a+2], tmax[a])
+            dper[b-3] = self._minmod(d[b-3], tmax[b-5])
         return dper
 
     def _compute_coeffs(self, d):
-        h = np.diff(self.x)
-        delta = np.diff(self.y) / h
-        self.coeffs = np.zeros((self.n - 1, 4))
+        h = self._bcast(np.diff(self.x))
+        delta = np.diff(self.y, axis=0) / h
+        self.coeffs = np.zeros((self.n - 1, 4) + self.y.shape[1:])
         c3 = (d[:-1] - 2*delta + d[1:]) / h**2
         c2 = (3*delta - 2*d[:-1] - d[1:]) / h
         self.coeffs[:, 0] = c3
@@ -164,16 +356,1047 @@ class PchipInterpolator:
         self.coeffs[:, 2] = d[:-1]
         self.coeffs[:, 3] = self.y[:-1]
 
-    def __call__(self, u):
-        is_scalar = not isinstance(u, np.ndarray)
+
+class PchipInterpolator(_HuynhFit):
+    """
+    PchipInterpolator: H.T. Huynh's accurate monotone cubic interpolant.
+
+    This class mimics the behavior of `scipy.interpolate.PchipInterpolator`
+    but uses H.T. Huyn's algorithm instead of F. N. Fritsch and J. Butland's.
+    """
+
+    def __init__(self, x, y, approx_order='cubic', mono_constraint='M3', axis=0, profile=False,
+                 dtype=np.float64, layout='rows'):
+        """
+        Initializes the interpolator.
+
+        Args:
+            x (np.ndarray): The knot vector.
+            y (np.ndarray): The data vector, or a 2-D array holding one curve per
+                            column (or row, see `axis`) sampled on the same knots.
+            approx_order (str): The order of the derivative approximation formula.
+                                Supported: 'cubic' (default), 'quartic'.
+            mono_constraint (str): The monotonicity constraint type.
+                                   Supported: 'M3' (default), 'M4'.
+            axis (int): The axis of y along which the knots vary. Default is 0.
+            profile (bool): Record the time and memory of each stage of the fit, the
+                            derivative estimates the monotonicity constraint clipped and
+                            the time of each call in a FitProfile, `self.profile`.
+            dtype (np.dtype): The storage type of the coefficients, which are fitted in
+                              float64 either way. Supported: np.float64 (default), np.float32.
+                              Queries are evaluated in the wider of this and their own type.
+            layout (str): The memory layout of `coeffs`, always indexed (n-1, 4).
+                          'rows' (default) keeps each interval's coefficients together,
+                          'columns' keeps each power's coefficients together.
+        """
+        self.profile = FitProfile() if profile else None
+        with self._stage('validate'):
+            if not isinstance(x, np.ndarray) or not isinstance(y, np.ndarray):
+                raise TypeError("x and y must be numpy arrays.")
+            if x.ndim != 1:
+                raise ValueError("x must be 1-dimensional.")
+            if y.ndim not in (1, 2):
+                raise ValueError("y must be 1- or 2-dimensional.")
+            if not -y.ndim <= axis < y.ndim:
+                raise ValueError(f"axis {axis} is out of bounds for y of dimension {y.ndim}.")
+            self.axis = int(axis) % y.ndim
+            y = np.moveaxis(y, self.axis, 0)
+            if x.shape[0] != y.shape[0]:
+                raise ValueError("x and y must have the same length along axis.")
+            if x.shape[0] < 5:
+                raise ValueError("There should be at least five data points.")
+            if not np.all(np.isfinite(x)) or not np.all(np.isfinite(y)):
+                raise ValueError("x and y must contain finite values.")
+
+            self.approx_order = approx_order
+            self.mono_constraint = mono_constraint
+
+            # Sort x and y; the knots are kept in float64 like the coefficients.
+            idx = np.argsort(x)
+            self.x = x[idx].astype(np.float64, copy=False)
+            self.y = y[idx]
+
+            h = np.diff(self.x)
+            if np.any(h <= 0):
+                raise ValueError("The data abscissae should be distinct and increasing.")
+
+            self.n = len(self.x)
+            self._starts = np.array([0])
+            self._ends = np.array([self.n])
+
+            # Knots on a uniform grid are located arithmetically.
+            self._step = _grid_step(self.x)
+        # Growable backing arrays for append/update, allocated on first use.
+        self._buffers = None
+
+        self._fit()
+        self.coeffs = _store_table(self.coeffs, dtype, layout)
+        self._layout = layout
+
+    @classmethod
+    def _from_fitted(cls, x, y, coeffs, approx_order, mono_constraint, axis):
+        """Wraps already fitted arrays without refitting or copying them."""
+        self = cls.__new__(cls)
+        self.approx_order = approx_order
+        self.mono_constraint = mono_constraint
+        self.axis = int(axis)
+        self.x = x
+        self.y = y
+        self.n = len(x)
+        self._starts = np.array([0])
+        self._ends = np.array([self.n])
+        self._step = _grid_step(x)
+        self._buffers = None
+        self._layout = 'rows'
+        self.coeffs = coeffs
+        return self
+
+    def save(self, path):
+        """
+        Writes the fitted interpolant to path, to be read back with `load`.
+
+        Args:
+            path (str or os.PathLike): The file to write.
+        """
+        config = {'approx_order': self.approx_order, 'mono_constraint': self.mono_constraint,
+                  'axis': self.axis}
+        _save_fitted(path, 'PchipInterpolator', config,
+                     {'x': self.x, 'y': self.y, 'coeffs': self.coeffs})
+
+    @classmethod
+    def load(cls, path, mmap=True):
+        """
+        Reads an interpolant written by `save`, without refitting.
+
+        Args:
+            path (str or os.PathLike): The file to read.
+            mmap (bool): Evaluate straight from a read-only memory map of the file,
+                         so that processes loading the same file share its pages.
+        """
+        config, arrays = _load_fitted(path, 'PchipInterpolator', mmap)
+        return cls._from_fitted(arrays['x'], arrays['y'], arrays['coeffs'], **config)
+
+    def to_ppoly(self):
+        """
+        Returns the interpolant as a `scipy.interpolate.PPoly`, which extrapolates
+        from the end intervals like this one.
+
+        SciPy's compiled evaluation wants a C-contiguous float64 `c`, indexed (4, n-1),
+        and copies any other table on every call. With float64 storage in the 'columns'
+        layout, `c` is exactly a transposed view of `self.coeffs`, so nothing is copied
+        and SciPy runs straight on the fitted table. Other storage is copied once here.
+        The breakpoints are `self.x` itself.
+        """
+        from scipy.interpolate import PPoly
+        c = np.ascontiguousarray(np.moveaxis(self.coeffs, 1, 0), dtype=np.float64)
+        return PPoly.construct_fast(c, self.x, True, self.axis)
+
+    def to_hermite(self):
+        """
+        Returns the knots, values and derivatives at the knots, e.g. for
+        `scipy.interpolate.CubicHermiteSpline(*interp.to_hermite(), axis=interp.axis)`.
+
+        x and y are views of the fitted arrays. The derivatives are Huynh's perturbed
+        estimates, read off the linear coefficients; the last one is the slope of the
+        last interval at x[-1], so this is the one array that is assembled.
+
+        Returns:
+            tuple: (x, y, dydx), with y and dydx laid out like the y passed in.
+        """
+        table = self.coeffs
+        dydx = np.empty(self.y.shape)
+        dydx[:-1] = table[:, -2] if table.shape[1] > 1 else 0
+        h_last = self._bcast(np.diff(self.x[-2:]))
+        dydx[-1] = self._horner(self._derivative_table(1, table[-1:]), np.array([0]), h_last)[0]
+        return self.x, np.moveaxis(self.y, 0, self.axis), np.moveaxis(dydx, 0, self.axis)
+
+    @classmethod
+    def from_ppoly(cls, ppoly):
+        """
+        Wraps a `scipy.interpolate.PPoly`, such as a CubicHermiteSpline or the result
+        of `to_ppoly`, without copying its coefficients or refitting.
+
+        The result evaluates, differentiates and integrates like a fitted interpolant,
+        but has no approx_order or mono_constraint, so `append` and `update` don't apply.
+
+        Args:
+            ppoly (scipy.interpolate.PPoly): A real piecewise polynomial with increasing
+                                             breakpoints and at most one trailing axis.
+        """
+        x = np.asarray(ppoly.x)
+        c = np.asarray(ppoly.c)
+        if c.ndim not in (2, 3) or np.iscomplexobj(c):
+            raise ValueError("ppoly must be real, with values of dimension 0 or 1.")
+        if len(x) < 2 or np.any(np.diff(x) <= 0):
+            raise ValueError("The data abscissae should be distinct and increasing.")
+        table = np.moveaxis(c, 0, 1)
+        # Take y at the knots from the constant terms plus the end of the last interval.
+        h_last = np.diff(x[-2:]).reshape((1,) + (1,) * (c.ndim - 2))
+        y_last = table[-1:, 0]
+        for k in range(1, table.shape[1]):
+            y_last = table[-1:, k] + h_last * y_last
+        y = np.concatenate([table[:, -1], y_last])
+        return cls._from_fitted(x, y, table, None, None, ppoly.axis)
+
+    def append(self, x_new, y_new):
+        """
+        Appends knots past the last one and refits only the intervals they affect.
+
+        The result matches a full refit exactly. Knots go into backing arrays that
+        double in capacity as needed, so a stream of appends costs amortized O(1)
+        per knot. `x`, `y` and `coeffs` become views of these arrays.
+
+        Args:
+            x_new (float or np.ndarray): The new knots, increasing and greater than x[-1].
+            y_new (float or np.ndarray): The data at the new knots, laid out along
+                                         axis for 2-D y; a single knot's data may
+                                         omit that axis.
+        """
+        if self.approx_order is None:
+            raise ValueError("append requires an interpolant fitted from data.")
+        x_new = np.asarray(x_new, dtype=float).reshape(-1)
+        y_new = np.asarray(y_new, dtype=float)
+        if y_new.ndim == self.y.ndim:
+            y_new = np.moveaxis(y_new, self.axis, 0)
+        else:
+            y_new = y_new[None]
+        if y_new.shape != (len(x_new),) + self.y.shape[1:]:
+            raise ValueError("y_new must hold one data point (or row, for 2-D y) per new knot.")
+        if not np.all(np.isfinite(x_new)) or not np.all(np.isfinite(y_new)):
+            raise ValueError("x and y must contain finite values.")
+        if np.any(np.diff(x_new) <= 0) or (len(x_new) and x_new[0] <= self.x[-1]):
+            raise ValueError("The data abscissae should be distinct and increasing.")
+        if not len(x_new):
+            return
+
+        n_old = self.n
+        self._reserve(n_old + len(x_new))
+        x, y, _ = self._buffers
+        x[n_old:n_old + len(x_new)] = x_new
+        y[n_old:n_old + len(x_new)] = y_new
+        self._resize(n_old + len(x_new))
+        if self._step is not None:
+            # Keep the grid lookup while the new knots stay within a quarter step of the grid.
+            grid = self.x[0] + self._step * np.arange(n_old, self.n)
+            if np.any(np.abs(x_new - grid) > 0.25 * self._step):
+                self._step = None
+        # The one-sided end formulas move, so the last few old intervals change too.
+        self._refit_rows(n_old - 1 - _REFIT_MARGIN, self.n - 1)
+
+    def update(self, i, y_new):
+        """
+        Replaces the data at knot i and refits only the intervals it affects.
+
+        The result matches a full refit exactly, at O(1) cost.
+
+        Args:
+            i (int): The index of the knot, counting from the end if negative.
+            y_new (float or np.ndarray): The new data at x[i].
+        """
+        if self.approx_order is None:
+            raise ValueError("update requires an interpolant fitted from data.")
+        i = int(i)
+        if not -self.n <= i < self.n:
+            raise IndexError(f"knot index {i} is out of range for {self.n} knots.")
+        i %= self.n
+        y_new = np.asarray(y_new, dtype=float)
+        if y_new.shape != self.y.shape[1:]:
+            raise ValueError(f"y_new must have shape {self.y.shape[1:]}.")
+        if not np.all(np.isfinite(y_new)):
+            raise ValueError("x and y must contain finite values.")
+
+        # Loaded interpolants may be read-only memory maps; refit into our own arrays.
+        self._reserve(self.n)
+        self._resize(self.n)
+        self.y[i] = y_new
+        self._refit_rows(i - _REFIT_MARGIN, i + _REFIT_MARGIN)
+
+    def _reserve(self, n):
+        """Makes room for n knots in the backing arrays, doubling their capacity."""
+        if self._buffers is not None and len(self._buffers[0]) >= n:
+            return
+        capacity = max(2 * n, 16)
+        trailing = self.y.shape[1:]
+        x = np.empty(capacity)
+        y = np.empty((capacity,) + trailing)
+        coeffs = _store_table(np.empty((capacity - 1, 4) + trailing, dtype=self.coeffs.dtype),
+                              self.coeffs.dtype, self._layout)
+        x[:self.n] = self.x
+        y[:self.n] = self.y
+        coeffs[:self.n - 1] = self.coeffs
+        self._buffers = (x, y, coeffs)
+
+    def _resize(self, n):
+        """Points x, y and coeffs at the first n knots of the backing arrays."""
+        x, y, coeffs = self._buffers
+        self.n = n
+        self.x = x[:n]
+        self.y = y[:n]
+        self.coeffs = coeffs[:n - 1]
+        self._ends = np.array([n])
+        self.__dict__.pop('_antiderivative_table', None)
+        self.__dict__.pop('_derivative_tables', None)
+
+    def _refit_rows(self, lo, hi):
+        """Refits coefficient rows lo..hi-1 from a window of knots around them."""
+        lo, hi = max(lo, 0), min(hi, self.n - 1)
+        a, b = max(lo - _REFIT_MARGIN, 0), min(hi + _REFIT_MARGIN, self.n)
+        window = self._from_fitted(self.x[a:b], self.y[a:b], None, self.approx_order,
+                                   self.mono_constraint, self.axis)
+        window._fit()
+        self.coeffs[lo:hi] = window.coeffs[lo - a:hi - a]
+
+    def __call__(self, u, nu=0, assume_sorted=False, out=None, chunk_size=None, workers=None):
+        """
+        Evaluates the interpolant or one of its derivatives.
+
+        Args:
+            u (float, np.ndarray or QueryPlan): The query points, or a plan built
+                                                on this interpolant's knots.
+            nu (int): The order of the derivative to evaluate. Default is 0.
+            assume_sorted (bool): Whether u is known to be in ascending order, which
+                                  allows a linear merge in place of a binary search.
+            out (np.ndarray): Optional array, e.g. an np.memmap, to write the result to.
+            chunk_size (int): Evaluate this many queries at a time, reusing scratch
+                              buffers, so that peak memory is O(output + chunk_size).
+                              Defaults to a cache-sized block when out or workers is given.
+            workers (int): Split the chunks across this many threads.
+        """
+        if self.profile is None:
+            return self._evaluate(u, nu, assume_sorted, out, chunk_size, workers)
+        start = time.perf_counter()
+        result = self._evaluate(u, nu, assume_sorted, out, chunk_size, workers)
+        self.profile.calls.append({'seconds': time.perf_counter() - start, 'queries': int(np.size(u))})
+        return result
+
+    def _evaluate(self, u, nu, assume_sorted, out, chunk_size, workers):
+        table = self._cached_derivative_table(nu)
+        if out is not None or chunk_size is not None or workers is not None:
+            return self._evaluate_chunked(table, u, assume_sorted, out, chunk_size, workers)
+        if isinstance(u, QueryPlan):
+            u._check_knots(self.x)
+            is_scalar = False
+            indices, s = u.indices, u.s
+            u = u.u
+        else:
+            is_scalar = not isinstance(u, np.ndarray)
+            if is_scalar:
+                u = np.array([u])
+            indices = _locate(self.x, u, self._step, assume_sorted)
+            s = u - self.x[indices]
+        # The offsets are exact in float64; the rest runs in the compute type.
+        compute, result = _compute_dtypes(table, u)
+        v = self._horner(table, indices, self._bcast(s.astype(compute, copy=False)))
+        return self._shape_result(v.astype(result, copy=False), u.ndim, is_scalar)
+
+    def _horner(self, table, indices, s):
+        """Evaluates the rows `indices` of a descending-power table at local offsets s."""
+        v = table[indices, 0]
+        for k in range(1, table.shape[1]):
+            v = table[indices, k] + s * v
+        return v
+
+    def _shape_result(self, v, ndim, is_scalar):
         if is_scalar:
-            u = np.array([u])
-        indices = np.searchsorted(self.x, u, side='right') - 1
-        indices = np.clip(indices, 0, self.n - 2)
-        s = u - self.x[indices]
-        c3 = self.coeffs[indices, 0]
-        c2 = self.coeffs[indices, 1]
-        c1 = self.coeffs[indices, 2]
-        c0 = self.coeffs[indices, 3]
+            return v[0]
+        if self.axis != 0:
+            # Put the query axes where the interpolation axis was in y.
+            v = np.moveaxis(v, tuple(range(ndim)), tuple(range(self.axis, self.axis + ndim)))
+        return v
+
+    def _derivative_table(self, nu, table=None):
+        if int(nu) != nu or nu < 0:
+            raise ValueError("nu must be a non-negative integer.")
+        table = self.coeffs if table is None else table
+        for _ in range(int(nu)):
+            k = table.shape[1]
+            if k == 1:
+                return np.zeros_like(table)
+            powers = np.arange(k - 1, 0, -1, dtype=table.dtype).reshape((k - 1,) + (1,) * (table.ndim - 2))
+            table = table[:, :-1] * powers
+        return table
+
+    def _cached_derivative_table(self, nu):
+        """The nu-th derivative table, kept per nu until the knots change."""
+        if nu == 0:
+            return self._derivative_table(nu)
+        tables = self.__dict__.setdefault('_derivative_tables', {})
+        if nu not in tables:
+            tables[nu] = self._derivative_table(nu)
+        return tables[nu]
+
+    @cached_property
+    def _antiderivative_table(self):
+        """The antiderivative vanishing at x[0]; its last column is the prefix sum of interval integrals."""
+        k = self.coeffs.shape[1]
+        powers = np.arange(k, 0, -1).reshape((k,) + (1,) * (self.coeffs.ndim - 2))
+        table = np.empty((self.n - 1, k + 1) + self.coeffs.shape[2:], dtype=self.coeffs.dtype)
+        table[:, :k] = self.coeffs / powers
+        h = self._bcast(np.diff(self.x))
+        integrals = table[:, 0]
+        for j in range(1, k):
+            integrals = integrals * h + table[:, j]
+        integrals = integrals * h
+        table[0, k] = 0
+        np.cumsum(integrals[:-1], axis=0, out=table[1:, k])
+        return table
+
+    def _with_table(self, table):
+        """
+        A new interpolant on the same knots with the given coefficient table. Like
+        `from_ppoly`, it isn't a fit of its knot data, so it has no fit configuration.
+        """
+        h_last = self._bcast(np.diff(self.x[-2:]))
+        y_last = self._horner(table, np.array([self.n - 2]), h_last)
+        y = np.concatenate([table[:, -1], y_last])
+        return self._from_fitted(self.x, y, table, None, None, self.axis)
+
+    def derivative(self, nu=1):
+        """
+        Constructs the piecewise polynomial of the nu-th derivative.
+
+        Args:
+            nu (int): The order of the derivative. Default is 1.
+        """
+        return self._with_table(self._derivative_table(nu))
+
+    def antiderivative(self, nu=1):
+        """
+        Constructs the piecewise polynomial of the nu-th antiderivative,
+        which vanishes at the first knot along with its lower derivatives.
+
+        Args:
+            nu (int): The order of the antiderivative. Default is 1.
+        """
+        if int(nu) != nu or nu < 0:
+            raise ValueError("nu must be a non-negative integer.")
+        result = self
+        for _ in range(int(nu)):
+            result = result._with_table(result._antiderivative_table)
+        return result
+
+    def integrate(self, a, b):
+        """
+        Computes the definite integral from a to b, extrapolating past the end knots.
+
+        Each bound costs one O(log n) interval lookup into a prefix sum of the
+        interval integrals, which is computed once.
+
+        Args:
+            a (float or np.ndarray): The lower limits.
+            b (float or np.ndarray): The upper limits; broadcast against a.
+        """
+        is_scalar = not isinstance(a, np.ndarray) and not isinstance(b, np.ndarray)
+        a, b = np.broadcast_arrays(np.asarray(a, dtype=float), np.asarray(b, dtype=float))
+        if is_scalar:
+            a, b = a.reshape(1), b.reshape(1)
+        table = self._antiderivative_table
+        values = []
+        for u in (a, b):
+            indices = _locate(self.x, u, self._step)
+            values.append(self._horner(table, indices, self._bcast(u - self.x[indices])))
+        return self._shape_result(values[1] - values[0], a.ndim, is_scalar)
+
+    def inverse(self, v, max_iter=100):
+        """
+        Inverts the interpolant of strictly monotone data, where Huynh's constraints
+        make it monotone on every interval.
+
+        Each value is bracketed by a searchsorted over y, and the cubic on that
+        interval is solved by a vectorized Newton iteration that falls back on
+        bisection whenever a step leaves the bracket.
+
+        Args:
+            v (float or np.ndarray): The values to invert. Those outside the range
+                                     of y have no preimage and map to NaN.
+            max_iter (int): The maximum number of Newton/bisection steps.
+
+        Raises:
+            ValueError: If y is not 1-dimensional and strictly monotone.
+        """
+        if self.y.ndim != 1:
+            raise ValueError("inverse requires 1-dimensional y.")
+        dy = np.diff(self.y)
+        if np.all(dy > 0):
+            sign = 1.0
+        elif np.all(dy < 0):
+            sign = -1.0
+        else:
+            raise ValueError("inverse requires strictly monotone data.")
+
+        is_scalar = not isinstance(v, np.ndarray)
+        shape = np.shape(v)
+        v = np.asarray(v, dtype=float).reshape(-1)
+        # Work with increasing f(s) = sign * (p(s) - v) on [0, h].
+        target = sign * v
+        indices = np.clip(np.searchsorted(sign * self.y, target, side='right') - 1, 0, self.n - 2)
+        h = np.diff(self.x)[indices]
+        y0 = sign * self.y[indices]
+        y1 = sign * self.y[indices + 1]
+        table = self.coeffs
+        slope = self._cached_derivative_table(1)
+
+        s = np.clip((target - y0) / (y1 - y0), 0, 1) * h
+        # Steps or residuals below these no longer change the answer appreciably.
+        eps = np.finfo(float).eps
+        s_tol = 2 * eps * (np.abs(self.x[indices]) + h)
+        f_tol = 4 * eps * np.max(np.abs(self.y))
+        # Only the values that have not converged yet are iterated on.
+        active = np.arange(len(s))
+        lo = np.zeros_like(h)
+        hi = h
+        for _ in range(max_iter):
+            if not active.size:
+                break
+            rows, s_a = indices[active], s[active]
+            f = sign * self._horner(table, rows, s_a) - target[active]
+            fp = sign * self._horner(slope, rows, s_a)
+            lo = np.where(f < 0, s_a, lo)
+            hi = np.where(f > 0, s_a, hi)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                step = np.where(fp > 0, s_a - f / fp, np.nan)
+            # Keep Newton steps that stay inside the bracket; bisect otherwise.
+            inside = (step >= lo) & (step <= hi)
+            s_new = np.where(inside, step, 0.5 * (lo + hi))
+            solved = np.abs(f) <= f_tol
+            s_new = np.where(solved, s_a, s_new)
+            s[active] = s_new
+            going = ~solved & (np.abs(s_new - s_a) > s_tol[active])
+            active, lo, hi = active[going], lo[going], hi[going]
+
+        u = self.x[indices] + s
+        u[(target < sign * self.y[0]) | (target > sign * self.y[-1]) | np.isnan(v)] = np.nan
+        return u[0] if is_scalar else u.reshape(shape)
+
+    def compress(self, tol):
+        """
+        Fits an interpolant on a subset of the knots that stays within tol of this one.
+
+        The subset starts from a uniform sample of the knots plus every knot where the
+        data changes direction, so the reduced data is monotone on the same stretches
+        and Huynh's constraints keep the reduced curve monotone there too. Each pass
+        then evaluates the reduced fit at all the knots and interval midpoints and adds
+        the middle original knot of every reduced interval that misses by more than tol.
+        If rounding keeps tol out of reach, it stops once no reduced interval has an
+        original knot left to add, and 'max_error' reports the error reached.
+
+        Args:
+            tol (float): The largest allowed deviation from the data at the knots and
+                         from this interpolant at the midpoints between them.
+
+        Returns:
+            tuple: The reduced PchipInterpolator and a dict holding the knot counts
+                   'n_original' and 'n_compressed', their 'ratio' and the 'max_error'.
+        """
+        if self.approx_order is None:
+            raise ValueError("compress requires an interpolant fitted from data.")
+        if not tol >= 0:
+            raise ValueError("tol must be non-negative.")
+        n, x = self.n, self.x
+        # Check points: the knots, where the target is the data, and the midpoints.
+        u = np.empty(2 * n - 1)
+        u[0::2] = x
+        u[1::2] = 0.5 * (x[:-1] + x[1:])
+        target = np.empty(u.shape + self.y.shape[1:])
+        target[0::2] = self.y
+        target[1::2] = self._horner(self.coeffs, np.arange(n - 1), self._bcast(u[1::2] - x[:-1]))
+
+        keep = np.zeros(n, dtype=bool)
+        keep[np.linspace(0, n - 1, 17).astype(np.intp)] = True
+        direction = np.sign(np.diff(self.y, axis=0)).reshape(n - 1, -1)
+        keep[1:-1] |= np.any(direction[1:] != direction[:-1], axis=1)
+
+        while True:
+            knots = np.flatnonzero(keep)
+            reduced = PchipInterpolator(x[knots], np.moveaxis(self.y[knots], 0, self.axis),
+                                        self.approx_order, self.mono_constraint, self.axis,
+                                        dtype=self.coeffs.dtype, layout=self._layout)
+            intervals = _locate(reduced.x, u, assume_sorted=True)
+            values = self._horner(reduced.coeffs, intervals, self._bcast(u - reduced.x[intervals]))
+            error = np.abs(values - target).reshape(len(u), -1).max(axis=1)
+            max_error = error.max()
+            splittable = np.diff(knots) > 1
+            if max_error <= tol or not np.any(splittable):
+                break
+            # Bisect the failing reduced intervals; one without original knots inside
+            # can only be fixed through its neighbours' derivative stencils.
+            failing = np.zeros(len(knots) - 1, dtype=bool)
+            failing[intervals[error > tol]] = True
+            while not np.any(failing & splittable):
+                failing[1:] |= failing[:-1].copy()
+                failing[:-1] |= failing[1:].copy()
+            split = np.flatnonzero(failing & splittable)
+            keep[(knots[split] + knots[split + 1]) // 2] = True
+
+        return reduced, {'n_original': n, 'n_compressed': reduced.n,
+                         'ratio': n / reduced.n, 'max_error': float(max_error)}
+
+    def _evaluate_chunked(self, table, u, assume_sorted, out, chunk_size, workers):
+        plan = None
+        if isinstance(u, QueryPlan):
+            u._check_knots(self.x)
+            plan, u = u, u.u
+        elif not isinstance(u, np.ndarray):
+            raise TypeError("u must be a numpy array when out, chunk_size or workers is given.")
+        chunk_size = _CHUNK_SIZE if chunk_size is None else int(chunk_size)
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be positive.")
+
+        # out_q is the result with the query axes first, as computed.
+        trailing = self.y.shape[1:]
+        query_axes = tuple(range(u.ndim))
+        result_axes = tuple(range(self.axis, self.axis + u.ndim))
+        if out is None:
+            out_q = np.empty(u.shape + trailing, dtype=_compute_dtypes(table, u)[1])
+            out = np.moveaxis(out_q, query_axes, result_axes)
+        else:
+            expected = trailing[:self.axis] + u.shape + trailing[self.axis:]
+            if out.shape != expected:
+                raise ValueError(f"out must have shape {expected}.")
+            compute = _compute_dtypes(table, u)[0]
+            if not np.can_cast(compute, out.dtype, casting='same_kind'):
+                raise TypeError(f"Cannot write {compute} results to out of dtype {out.dtype}.")
+            out_q = np.moveaxis(out, result_axes, query_axes)
+        u_flat = u.reshape(-1)
+        out_flat = out_q.reshape((-1,) + trailing)
+        if out_flat.size and not np.may_share_memory(out_flat, out_q):
+            raise ValueError("out must allow a flat view of its query axes.")
+        if plan is not None:
+            located = (plan.indices.reshape(-1), plan.s.reshape(-1))
+        else:
+            located = None
+
+        total = len(u_flat)
+        workers = 1 if workers is None else int(workers)
+        if workers < 1:
+            raise ValueError("workers must be positive.")
+        if workers == 1 or total <= chunk_size:
+            self._evaluate_range(table, u_flat, out_flat, located, 0, total, chunk_size, assume_sorted)
+            return out
+
+        # Contiguous ranges, one per thread; the NumPy kernels release the GIL.
+        bounds = np.linspace(0, total, min(workers, -(-total // chunk_size)) + 1).astype(np.intp)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(self._evaluate_range, table, u_flat, out_flat, located,
+                                   start, stop, chunk_size, assume_sorted)
+                       for start, stop in zip(bounds[:-1], bounds[1:])]
+            for future in futures:
+                future.result()
+        return out
+
+    def _evaluate_range(self, table, u_flat, out_flat, located, begin, end, chunk_size, assume_sorted):
+        """Evaluates u_flat[begin:end] into out_flat chunk by chunk, reusing scratch buffers."""
+        trailing = self.y.shape[1:]
+        size = min(chunk_size, end - begin)
+        compute = _compute_dtypes(table, u_flat)[0]
+        s_buf = np.empty(size)
+        s_compute = s_buf if compute == s_buf.dtype else np.empty(size, dtype=compute)
+        gather = np.empty((size,) + trailing, dtype=table.dtype)
+        acc = np.empty((size,) + trailing, dtype=compute)
+        columns = [table[:, k] for k in range(table.shape[1])]
+
+        for start in range(begin, end, chunk_size):
+            stop = min(start + chunk_size, end)
+            k = stop - start
+            if located is not None:
+                indices = located[0][start:stop]
+                s = located[1][start:stop]
+            else:
+                u_chunk = u_flat[start:stop]
+                indices = _locate(self.x, u_chunk, self._step, assume_sorted)
+                s = np.take(self.x, indices, out=s_buf[:k], mode='clip')
+                np.subtract(u_chunk, s, out=s)
+            if s_compute is not s_buf:
+                np.copyto(s_compute[:k], s, casting='same_kind')
+                s = s_compute[:k]
+            s = self._bcast(s)
+            a = acc[:k]
+            g = gather[:k]
+            # Same Horner order as _horner, e.g. c0 + s*(c1 + s*(c2 + s*c3)).
+            if g.dtype == a.dtype:
+                np.take(columns[0], indices, axis=0, out=a, mode='clip')
+            else:
+                np.take(columns[0], indices, axis=0, out=g, mode='clip')
+                np.copyto(a, g)
+            for column in columns[1:]:
+                np.multiply(a, s, out=a)
+                np.take(column, indices, axis=0, out=g, mode='clip')
+                np.add(a, g, out=a)
+            out_flat[start:stop] = a
+
+
+class QueryPlan:
+    """
+    QueryPlan: the located intervals and local offsets of a fixed set of queries.
+
+    Building a plan does the interval search once; any interpolant on the same
+    knots then evaluates it with only the coefficient gather and Horner step,
+    via `interp(plan)`. `evaluate` handles a stack of coefficient tables at once.
+    """
+
+    def __init__(self, x, u, assume_sorted=False):
+        """
+        Initializes the plan.
+
+        Args:
+            x (np.ndarray): The knot vector, sorted and distinct.
+            u (np.ndarray): The query points.
+            assume_sorted (bool): Whether u is known to be in ascending order.
+        """
+        if not isinstance(x, np.ndarray) or x.ndim != 1:
+            raise ValueError("x must be a 1-dimensional numpy array.")
+        if x.shape[0] < 2 or np.any(np.diff(x) <= 0):
+            raise ValueError("The data abscissae should be distinct and increasing.")
+        self.x = x
+        self.u = np.asarray(u, dtype=float)
+        self.indices = _locate(x, self.u, _grid_step(x), assume_sorted)
+        self.s = self.u - x[self.indices]
+        self._powers = None
+        # Knot arrays already compared in full, by id, so each is checked once.
+        self._checked = {}
+
+    def _check_knots(self, x):
+        ref = self._checked.get(id(x))
+        if x is self.x or (ref is not None and ref() is x):
+            return
+        if not np.array_equal(x, self.x):
+            raise ValueError("The query plan was built on different knots.")
+        key, checked = id(x), self._checked
+        checked[key] = weakref.ref(x, lambda _: checked.pop(key, None))
+
+    def evaluate(self, coeffs):
+        """
+        Evaluates a stack of coefficient tables on the plan's knots.
+
+        Args:
+            coeffs (np.ndarray): Tables of shape (..., n-1, 4), e.g.
+                                 np.stack([interp.coeffs for interp in interps]).
+
+        Returns:
+            np.ndarray: The values, of shape coeffs.shape[:-2] + u.shape.
+        """
+        coeffs = np.asarray(coeffs)
+        if coeffs.ndim < 2 or coeffs.shape[-2:] != (len(self.x) - 1, 4):
+            raise ValueError("coeffs must have shape (..., n-1, 4) for the plan's knots.")
+        if self._powers is None:
+            s = self.s
+            self._powers = np.stack([s**3, s**2, s, np.ones_like(s)], axis=-1)
+        return np.einsum('...uk,uk->...u', coeffs[..., self.indices.ravel(), :],
+                         self._powers.reshape(-1, 4)).reshape(coeffs.shape[:-2] + self.u.shape)
+
+
+class PchipBatch(_HuynhFit):
+    """
+    PchipBatch: many independent Huynh interpolants with their own knot vectors.
+
+    The curves are stored end to end, CSR style: the knots of curve `c` are
+    `x[offsets[c]:offsets[c+1]]` and its coefficients are the rows
+    `coeffs[offsets[c]-c:offsets[c+1]-c-1]` of one contiguous table.
+    """
+
+    def __init__(self, x, y, offsets, approx_order='cubic', mono_constraint='M3', workers=None):
+        """
+        Initializes the batch.
+
+        Args:
+            x (np.ndarray): The knot vectors of all curves, concatenated.
+            y (np.ndarray): The data vectors of all curves, concatenated.
+            offsets (np.ndarray): Curve c occupies x[offsets[c]:offsets[c+1]].
+            approx_order (str): The order of the derivative approximation formula.
+                                Supported: 'cubic' (default), 'quartic'.
+            mono_constraint (str): The monotonicity constraint type.
+                                   Supported: 'M3' (default), 'M4'.
+            workers (int): Fit groups of curves in this many processes, which
+                           return their coefficients through shared memory.
+        """
+        if not isinstance(x, np.ndarray) or not isinstance(y, np.ndarray):
+            raise TypeError("x and y must be numpy arrays.")
+        if x.ndim != 1 or y.ndim != 1:
+            raise ValueError("x and y must be 1-dimensional.")
+        if x.shape != y.shape:
+            raise ValueError("x and y must have the same shape.")
+        offsets = np.asarray(offsets)
+        if offsets.ndim != 1 or len(offsets) < 2 or not np.issubdtype(offsets.dtype, np.integer):
+            raise ValueError("offsets must be a 1-dimensional integer array with at least two entries.")
+        if offsets[0] != 0 or offsets[-1] != len(x):
+            raise ValueError("offsets must start at 0 and end at len(x).")
+        if np.any(np.diff(offsets) < 5):
+            raise ValueError("There should be at least five data points per curve.")
+        if not np.all(np.isfinite(x)) or not np.all(np.isfinite(y)):
+            raise ValueError("x and y must contain finite values.")
+
+        self.approx_order = approx_order
+        self.mono_constraint = mono_constraint
+        self.offsets = offsets.astype(np.intp)
+        self.n_curves = len(offsets) - 1
+        self._starts = self.offsets[:-1]
+        self._ends = self.offsets[1:]
+
+        # Sort x and y within each curve
+        curve_ids = np.repeat(np.arange(self.n_curves), np.diff(self.offsets))
+        idx = np.lexsort((x, curve_ids))
+        self.x = x[idx]
+        self.y = y[idx]
+
+        h = np.delete(np.diff(self.x), self._ends[:-1] - 1)
+        if np.any(h <= 0):
+            raise ValueError("The data abscissae should be distinct and increasing.")
+
+        self.n = len(self.x)
+
+        workers = 1 if workers is None else int(workers)
+        if workers < 1:
+            raise ValueError("workers must be positive.")
+        if workers > 1 and self.n_curves > 1:
+            self._fit_parallel(workers)
+        else:
+            self._fit_segments()
+
+    @classmethod
+    def _from_sorted(cls, x, y, offsets, approx_order, mono_constraint, coeffs=None):
+        """Fits curves whose knots are already sorted and validated, unless given coeffs."""
+        self = cls.__new__(cls)
+        self.approx_order = approx_order
+        self.mono_constraint = mono_constraint
+        self.offsets = offsets
+        self.n_curves = len(offsets) - 1
+        self._starts = offsets[:-1]
+        self._ends = offsets[1:]
+        self.x = x
+        self.y = y
+        self.n = len(x)
+        if coeffs is None:
+            self._fit_segments()
+        else:
+            self.coeffs = coeffs
+        return self
+
+    def _fit_segments(self):
+        # Stencils straddling two curves may divide by zero; those values are discarded.
+        with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+            self._fit()
+        self.coeffs = np.delete(self.coeffs, self._ends[:-1] - 1, axis=0)
+
+    def _fit_parallel(self, workers):
+        # Contiguous groups of curves holding roughly equal numbers of knots.
+        targets = np.linspace(0, self.n, workers + 1)[1:-1]
+        bounds = np.unique(np.concatenate(([0], np.searchsorted(self.offsets, targets), [self.n_curves])))
+
+        shapes = [(self.n,), (self.n,), (self.n - self.n_curves, 4)]
+        blocks = [shared_memory.SharedMemory(create=True, size=max(8 * int(np.prod(shape)), 1))
+                  for shape in shapes]
+        try:
+            np.ndarray(shapes[0], buffer=blocks[0].buf)[:] = self.x
+            np.ndarray(shapes[1], buffer=blocks[1].buf)[:] = self.y
+            names = [block.name for block in blocks]
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = [pool.submit(_fit_curve_group, names, shapes, self.offsets, first, last,
+                                       self.approx_order, self.mono_constraint)
+                           for first, last in zip(bounds[:-1], bounds[1:])]
+                for future in futures:
+                    future.result()
+            self.coeffs = np.ndarray(shapes[2], buffer=blocks[2].buf).copy()
+        finally:
+            for block in blocks:
+                block.close()
+                block.unlink()
+
+    def save(self, path):
+        """
+        Writes the fitted batch to path, to be read back with `load`.
+
+        Args:
+            path (str or os.PathLike): The file to write.
+        """
+        config = {'approx_order': self.approx_order, 'mono_constraint': self.mono_constraint}
+        _save_fitted(path, 'PchipBatch', config,
+                     {'x': self.x, 'y': self.y, 'offsets': self.offsets, 'coeffs': self.coeffs})
+
+    @classmethod
+    def load(cls, path, mmap=True):
+        """
+        Reads a batch written by `save`, without refitting.
+
+        Args:
+            path (str or os.PathLike): The file to read.
+            mmap (bool): Evaluate straight from a read-only memory map of the file.
+        """
+        config, arrays = _load_fitted(path, 'PchipBatch', mmap)
+        return cls._from_sorted(arrays['x'], arrays['y'], np.asarray(arrays['offsets'], dtype=np.intp),
+                                coeffs=arrays['coeffs'], **config)
+
+    @classmethod
+    def from_curves(cls, curves, approx_order='cubic', mono_constraint='M3', workers=None):
+        """
+        Builds a batch from a sequence of (x, y) pairs.
+
+        Args:
+            curves (sequence): The (x, y) knot and data vectors of each curve.
+            approx_order (str): See `PchipBatch.__init__`.
+            mono_constraint (str): See `PchipBatch.__init__`.
+            workers (int): See `PchipBatch.__init__`.
+        """
+        curves = list(curves)
+        if not curves:
+            raise ValueError("There should be at least one curve.")
+        lengths = [len(x) for x, _ in curves]
+        offsets = np.concatenate(([0], np.cumsum(lengths)))
+        x = np.concatenate([np.asarray(x, dtype=float) for x, _ in curves])
+        y = np.concatenate([np.asarray(y, dtype=float) for _, y in curves])
+        return cls(x, y, offsets, approx_order=approx_order, mono_constraint=mono_constraint,
+                   workers=workers)
+
+    def _locate(self, curve_id, u):
+        """Finds the knot index starting the interval of each (curve_id, u) pair."""
+        # Bisection over every query at once, each within its own curve's knots.
+        lo = self._starts[curve_id]
+        hi = self._ends[curve_id] - 2
+        while np.any(lo < hi):
+            mid = (lo + hi + 1) // 2
+            right = self.x[mid] <= u
+            lo = np.where(right, mid, lo)
+            hi = np.where(right, hi, mid - 1)
+        return lo
+
+    def __call__(self, curve_id, u):
+        """
+        Evaluates curve `curve_id` at `u`; both arguments broadcast together.
+        """
+        is_scalar = not isinstance(curve_id, np.ndarray) and not isinstance(u, np.ndarray)
+        curve_id, u = np.broadcast_arrays(np.asarray(curve_id), np.asarray(u, dtype=float))
+        if np.any(curve_id < 0) or np.any(curve_id >= self.n_curves):
+            raise IndexError("curve_id out of range.")
+        knots = self._locate(curve_id, u)
+        s = u - self.x[knots]
+        rows = knots - curve_id
+        c3 = self.coeffs[rows, 0]
+        c2 = self.coeffs[rows, 1]
+        c1 = self.coeffs[rows, 2]
+        c0 = self.coeffs[rows, 3]
         v = c0 + s * (c1 + s * (c2 + s * c3))
-        return v[0] if is_scalar else v
+        return v[()] if is_scalar else v
+
+
+def _slice(a, axis, start, stop):
+    """Slices a along one axis."""
+    return a[(slice(None),) * axis + (slice(start, stop),)]
+
+
+class PchipGridInterpolator:
+    """
+    PchipGridInterpolator: a tensor-product Huynh interpolant on a rectilinear grid.
+
+    The derivative along each axis, and the mixed derivatives, are Huynh's perturbed
+    estimates, fitted one axis at a time over every grid line at once; the first
+    derivatives are taken from the data, the mixed ones from the derivatives already
+    found. Each cell then holds the tensor-product cubic Hermite polynomial of its
+    corners in local, descending-power form, so the surface reduces to the 1-D
+    interpolant along every grid line and keeps its monotonicity there.
+    """
+
+    def __init__(self, points, values, approx_order='cubic', mono_constraint='M3'):
+        """
+        Initializes the interpolator.
+
+        Args:
+            points (sequence of np.ndarray): The increasing knot vector of each axis,
+                                             with at least five knots each.
+            values (np.ndarray): The data on the grid, of shape (len(points[0]), ...).
+            approx_order (str): See `PchipInterpolator.__init__`.
+            mono_constraint (str): See `PchipInterpolator.__init__`.
+        """
+        if not isinstance(values, np.ndarray):
+            raise TypeError("values must be a numpy array.")
+        self.grid = tuple(np.asarray(p, dtype=float) for p in points)
+        self.ndim = len(self.grid)
+        if self.ndim < 1 or values.shape != tuple(len(p) for p in self.grid):
+            raise ValueError("values must have one axis per knot vector, of matching length.")
+        for p in self.grid:
+            if p.ndim != 1 or len(p) < 5:
+                raise ValueError("Each knot vector must be 1-dimensional, with at least five data points.")
+            if not np.all(np.isfinite(p)) or np.any(np.diff(p) <= 0):
+                raise ValueError("The data abscissae should be distinct and increasing.")
+        if not np.all(np.isfinite(values)):
+            raise ValueError("values must contain finite values.")
+
+        self.approx_order = approx_order
+        self.mono_constraint = mono_constraint
+        self.values = values.astype(float)
+        self._steps = [_grid_step(p) for p in self.grid]
+
+        # nodes[a_0, ..., a_i-1] holds the derivative of order a_k along axis k.
+        nodes = self.values
+        for i, p in enumerate(self.grid):
+            nodes = np.stack([nodes, self._axis_derivative(nodes, p, 2 * i)], axis=i)
+        # Swap each pair of derivative orders at the two ends of a cell for the
+        # cubic's coefficients; the grid axis i then counts cells.
+        for i, p in enumerate(self.grid):
+            grid_axis = self.ndim + i
+            h = np.diff(p).reshape((-1,) + (1,) * (2 * self.ndim - 1 - grid_axis))
+            f, d = np.take(nodes, 0, axis=i), np.take(nodes, 1, axis=i)
+            grid_axis -= 1
+            f0 = _slice(f, grid_axis, 0, -1)
+            delta = np.diff(f, axis=grid_axis) / h
+            d0, d1 = _slice(d, grid_axis, 0, -1), _slice(d, grid_axis, 1, None)
+            nodes = np.stack([(d0 - 2*delta + d1) / h**2, (3*delta - 2*d0 - d1) / h, d0, f0], axis=i)
+        # Cells first, then the powers of axis 0, 1, ..., for one gather per query.
+        self.coeffs = np.ascontiguousarray(np.moveaxis(nodes, tuple(range(self.ndim)),
+                                                       tuple(range(self.ndim, 2 * self.ndim))))
+
+    def _axis_derivative(self, nodes, p, axis):
+        """Huynh's derivative estimates along `axis` of nodes, for every grid line at once."""
+        lines = np.moveaxis(nodes, axis, 0)
+        fit = PchipInterpolator._from_fitted(p, lines.reshape(len(p), -1), None, self.approx_order,
+                                             self.mono_constraint, 0)
+        return np.moveaxis(fit._knot_derivatives().reshape(lines.shape), 0, axis)
+
+    def __call__(self, u):
+        """
+        Evaluates the interpolant, extrapolating from the cells at the edges.
+
+        Args:
+            u (np.ndarray): The query points, of shape (..., ndim).
+        """
+        u = np.asarray(u, dtype=float)
+        if u.shape[-1:] != (self.ndim,):
+            raise ValueError(f"u must have shape (..., {self.ndim}).")
+        shape = u.shape[:-1]
+        u = u.reshape(-1, self.ndim)
+        table = self.coeffs.reshape((-1,) + self.coeffs.shape[self.ndim:])
+        out = np.empty(len(u))
+        # Each query gathers 4**ndim coefficients; keep a block of them in cache.
+        chunk_size = max(_GRID_CHUNK_BYTES // table[0].nbytes, 1)
+        for start in range(0, len(u), chunk_size):
+            block = u[start:start + chunk_size]
+            cells = np.zeros(len(block), dtype=np.intp)
+            offsets = []
+            for i, p in enumerate(self.grid):
+                indices = _locate(p, block[:, i], self._steps[i])
+                cells = cells * (len(p) - 1) + indices
+                offsets.append(block[:, i] - p[indices])
+            v = np.take(table, cells, axis=0)
+            # Horner along the last axis first, contracting one power axis per step.
+            for s in reversed(offsets):
+                s = s.reshape((-1,) + (1,) * (v.ndim - 2))
+                acc = v[..., 0]
+                for k in range(1, 4):
+                    acc = v[..., k] + s * acc
+                v = acc
+            out[start:start + chunk_size] = v
+        return out.reshape(shape)
+
+
+def _fit_curve_group(names, shapes, offsets, first, last, approx_order, mono_constraint):
+    """Fits curves first..last-1 of a PchipBatch in a worker process, via shared memory."""
+    blocks = [shared_memory.SharedMemory(name=name) for name in names]
+    try:
+        x, y, coeffs = [np.ndarray(shape, buffer=block.buf) for shape, block in zip(shapes, blocks)]
+        a, b = offsets[first], offsets[last]
+        part = PchipBatch._from_sorted(x[a:b], y[a:b], offsets[first:last + 1] - a,
+                                       approx_order, mono_constraint)
+        coeffs[a - first:b - last] = part.coeffs
+        # The views must go before the blocks can be closed.
+        del x, y, coeffs, part
+    finally:
+        for block in blocks:
+            block.close()
@@ -0,0 +1,106 @@
+import numpy as np
+import pytest
+import pchips
+
+CONFIGURATIONS = [
+    {'approx_order': 'cubic', 'mono_constraint': 'M4'},
+    {'approx_order': 'cubic', 'mono_constraint': 'M3'},
+    {'approx_order': 'quartic', 'mono_constraint': 'M4'},
+    {'approx_order': 'quartic', 'mono_constraint': 'M3'},
+]
+
+@pytest.fixture(scope="module")
+def curves():
+    rng = np.random.default_rng(0)
+    x = np.cumsum(rng.uniform(0.1, 2.0, 40))
+    y = np.column_stack([np.sin(x / 3), np.cumsum(rng.uniform(0, 1, 40)), rng.normal(size=40)])
+    return x, y
+
+@pytest.mark.parametrize("config", CONFIGURATIONS)
+def test_columns_match_single_fits(curves, config):
+    x, y = curves
+    u = np.linspace(x.min() - 1, x.max() + 1, 501)
+
+    interp = pchips.PchipInterpolator(x, y, **config)
+    assert interp.coeffs.shape == (len(x) - 1, 4, y.shape[1])
+    results = interp(u)
+    assert results.shape == (len(u), y.shape[1])
+
+    for j in range(y.shape[1]):
+        single = pchips.PchipInterpolator(x, y[:, j], **config)
+        np.testing.assert_array_equal(interp.coeffs[:, :, j], single.coeffs)
+        np.testing.assert_array_equal(results[:, j], single(u))
+
+@pytest.mark.parametrize("config", CONFIGURATIONS)
+def test_axis(curves, config):
+    x, y = curves
+    u = np.linspace(x.min(), x.max(), 101)
+
+    by_column = pchips.PchipInterpolator(x, y, axis=0, **config)
+    by_row = pchips.PchipInterpolator(x, y.T, axis=1, **config)
+    np.testing.assert_array_equal(by_row.coeffs, by_column.coeffs)
+    np.testing.assert_array_equal(by_row(u), by_column(u).T)
+    np.testing.assert_array_equal(by_row(u[3]), by_column(u)[3])
+
+def test_shape_validation(curves):
+    x, y = curves
+    with pytest.raises(ValueError):
+        pchips.PchipInterpolator(x, y, axis=1)
+    with pytest.raises(ValueError):
+        pchips.PchipInterpolator(x, y, axis=2)
+    with pytest.raises(ValueError):
+        pchips.PchipInterpolator(x, y[:, :, None])
+
+@pytest.fixture(scope="module")
+def ragged_curves():
+    rng = np.random.default_rng(1)
+    curves = []
+    for n in [5, 6, 7, 12, 30, 5, 61]:
+        x = np.cumsum(rng.uniform(0.1, 2.0, n)) - rng.uniform(0.0, 20.0)
+        y = rng.normal(size=n) if n % 2 else np.cumsum(rng.uniform(0, 1, n))
+        # Shuffle to exercise the per-curve sort.
+        perm = rng.permutation(n)
+        curves.append((x[perm], y[perm]))
+    return curves
+
+@pytest.mark.parametrize("config", CONFIGURATIONS)
+def test_ragged_batch_matches_single_fits(ragged_curves, config):
+    batch = pchips.PchipBatch.from_curves(ragged_curves, **config)
+    assert batch.coeffs.shape == (sum(len(x) for x, _ in ragged_curves) - len(ragged_curves), 4)
+
+    curve_ids = []
+    queries = []
+    expected = []
+    for c, (x, y) in enumerate(ragged_curves):
+        single = pchips.PchipInterpolator(x, y, **config)
+        start, end = batch.offsets[c] - c, batch.offsets[c + 1] - c - 1
+        np.testing.assert_array_equal(batch.coeffs[start:end], single.coeffs)
+        u = np.concatenate([np.linspace(x.min() - 1, x.max() + 1, 97), x])
+        curve_ids.append(np.full(len(u), c))
+        queries.append(u)
+        expected.append(single(u))
+
+    # All curves, interleaved, in one call.
+    curve_ids = np.concatenate(curve_ids)
+    queries = np.concatenate(queries)
+    expected = np.concatenate(expected)
+    perm = np.random.default_rng(2).permutation(len(queries))
+    np.testing.assert_array_equal(batch(curve_ids[perm], queries[perm]), expected[perm])
+    assert batch(3, queries[0]) == pchips.PchipInterpolator(*ragged_curves[3], **config)(queries[0])
+
+def test_ragged_batch_validation(ragged_curves):
+    x = np.concatenate([x for x, _ in ragged_curves[:2]])
+    y = np.concatenate([y for _, y in ragged_curves[:2]])
+    with pytest.raises(ValueError):
+        pchips.PchipBatch(x, y, np.array([0, 4, len(x)]))
+    with pytest.raises(ValueError):
+        pchips.PchipBatch(x, y, np.array([0, 5]))
+    batch = pchips.PchipBatch(x, y, np.array([0, 5, len(x)]))
+    with pytest.raises(IndexError):
+        batch(2, 0.0)
+
+@pytest.mark.parametrize("config", CONFIGURATIONS)
+def test_ragged_batch_process_pool(ragged_curves, config):
+    serial = pchips.PchipBatch.from_curves(ragged_curves, **config)
+    parallel = pchips.PchipBatch.from_curves(ragged_curves, workers=3, **config)
+    np.testing.assert_array_equal(parallel.coeffs, serial.coeffs)
@@ -0,0 +1,91 @@
+import threading
+
+import numpy as np
+import pytest
+import pchips
+
+@pytest.fixture
+def data():
+    rng = np.random.default_rng(0)
+    x = np.cumsum(rng.uniform(0.1, 2.0, 100))
+    return x, np.sin(x / 4)
+
+def test_hits_and_misses(data):
+    x, y = data
+    cache = pchips.InterpolatorCache()
+    first = pchips.cached_interpolator(x, y, cache=cache)
+    second = pchips.cached_interpolator(x.copy(), y.copy(), cache=cache)
+    assert (cache.hits, cache.misses, len(cache)) == (1, 1, 1)
+    assert np.shares_memory(second.coeffs, first.coeffs)
+    np.testing.assert_array_equal(second.coeffs, pchips.PchipInterpolator(x, y).coeffs)
+
+    pchips.cached_interpolator(x, y, approx_order='quartic', cache=cache)
+    pchips.cached_interpolator(x, y, mono_constraint='M4', cache=cache)
+    pchips.cached_interpolator(x, y, axis=np.int64(0), cache=cache)
+    assert (cache.hits, cache.misses) == (2, 3)
+    changed = y.copy()
+    changed[50] += 1e-12
+    pchips.cached_interpolator(x, changed, cache=cache)
+    assert (cache.hits, cache.misses, len(cache)) == (2, 4, 4)
+
+def test_callers_are_isolated(data):
+    x, y = data
+    cache = pchips.InterpolatorCache()
+    interp = cache.get(x, y)
+    interp.update(3, 5.0)
+    interp.append(x[-1] + 1, 0.0)
+    again = cache.get(x, y)
+    np.testing.assert_array_equal(again.coeffs, pchips.PchipInterpolator(x, y).coeffs)
+    assert not again.coeffs.flags.writeable
+
+def test_lru_eviction(data):
+    x, y = data
+    size = x.nbytes + y.nbytes + pchips.PchipInterpolator(x, y).coeffs.nbytes
+    cache = pchips.InterpolatorCache(max_bytes=2 * size)
+    for k in range(3):
+        cache.get(x, y + k)
+    assert (len(cache), cache.evictions, cache.nbytes) == (2, 1, 2 * size)
+    cache.get(x, y + 1)
+    cache.get(x, y + 3)
+    # y + 2 was least recently used.
+    cache.get(x, y + 1)
+    assert (cache.hits, cache.misses, cache.evictions) == (2, 4, 2)
+
+    tiny = pchips.InterpolatorCache(max_bytes=size - 1)
+    tiny.get(x, y)
+    assert (len(tiny), tiny.nbytes, tiny.evictions) == (0, 0, 0)
+
+def test_concurrent_callers_share_one_fit(data, monkeypatch):
+    x, y = data
+    cache = pchips.InterpolatorCache()
+    fits = []
+    release = threading.Event()
+    original = pchips.PchipInterpolator._fit
+
+    def slow_fit(self):
+        fits.append(1)
+        release.wait()
+        original(self)
+    monkeypatch.setattr(pchips.PchipInterpolator, '_fit', slow_fit)
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cache.get(x, y))) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    while cache.hits + cache.misses < 8:
+        threading.Event().wait(0.001)
+    release.set()
+    for thread in threads:
+        thread.join()
+    assert len(fits) == 1
+    assert (cache.hits, cache.misses) == (7, 1)
+    assert all(np.shares_memory(r.coeffs, results[0].coeffs) for r in results)
+
+def test_failed_fit_is_not_cached(data):
+    x, y = data
+    cache = pchips.InterpolatorCache()
+    with pytest.raises(ValueError):
+        cache.get(x[:4], y[:4])
+    with pytest.raises(ValueError):
+        cache.get(x[:4], y[:4])
+    assert (len(cache), cache.misses) == (0, 2)
@@ -0,0 +1,75 @@
+import numpy as np
+import pytest
+import pchips
+import scipy.interpolate as interpolate
+
+CONFIGURATIONS = [
+    {'approx_order': 'cubic', 'mono_constraint': 'M4'},
+    {'approx_order': 'cubic', 'mono_constraint': 'M3'},
+    {'approx_order': 'quartic', 'mono_constraint': 'M4'},
+    {'approx_order': 'quartic', 'mono_constraint': 'M3'},
+]
+
+@pytest.fixture(scope="module")
+def data():
+    rng = np.random.default_rng(0)
+    x = np.cumsum(rng.uniform(0.1, 2.0, 25))
+    return x, np.sin(x / 4) + 0.1 * x
+
+def as_ppoly(interp):
+    return interpolate.PPoly(np.moveaxis(interp.coeffs, 1, 0), interp.x)
+
+@pytest.mark.parametrize("config", CONFIGURATIONS)
+def test_derivatives_match_ppoly(data, config):
+    x, y = data
+    interp = pchips.PchipInterpolator(x, y, **config)
+    ppoly = as_ppoly(interp)
+    u = np.linspace(x[0] - 1, x[-1] + 1, 777)
+    for nu in range(5):
+        np.testing.assert_allclose(interp(u, nu=nu), ppoly(u, nu=nu), rtol=1e-12, atol=1e-12)
+        np.testing.assert_allclose(interp.derivative(nu)(u), ppoly(u, nu=nu), rtol=1e-12, atol=1e-12)
+        np.testing.assert_allclose(interp(u, nu=nu, chunk_size=100), interp(u, nu=nu))
+    # The first derivative at the knots is the perturbed derivative estimate.
+    np.testing.assert_allclose(interp.derivative().y[:-1], interp.coeffs[:, 2])
+
+@pytest.mark.parametrize("config", CONFIGURATIONS)
+def test_antiderivative_and_integrate_match_ppoly(data, config):
+    x, y = data
+    interp = pchips.PchipInterpolator(x, y, **config)
+    ppoly = as_ppoly(interp)
+    u = np.linspace(x[0] - 1, x[-1] + 1, 777)
+    for nu in range(1, 3):
+        np.testing.assert_allclose(interp.antiderivative(nu)(u), ppoly.antiderivative(nu)(u), rtol=1e-11, atol=1e-11)
+    np.testing.assert_allclose(interp.antiderivative().derivative()(u), interp(u), rtol=1e-12, atol=1e-12)
+
+    rng = np.random.default_rng(1)
+    a = rng.uniform(x[0] - 1, x[-1] + 1, 300)
+    b = rng.uniform(x[0] - 1, x[-1] + 1, 300)
+    expected = np.array([ppoly.integrate(lo, hi) for lo, hi in zip(a, b)])
+    np.testing.assert_allclose(interp.integrate(a, b), expected, rtol=1e-11, atol=1e-11)
+    assert interp.integrate(b[0], a[0]) == pytest.approx(-expected[0])
+
+def test_integrate_curve_batch(data):
+    x, y = data
+    interp = pchips.PchipInterpolator(x, np.vstack([y, 2 * y]), axis=1)
+    single = pchips.PchipInterpolator(x, y)
+    a = np.array([x[0], x[3] + 0.1])
+    np.testing.assert_allclose(interp.integrate(a, x[-1]), np.vstack([1, 2]) * single.integrate(a, x[-1]))
+    assert interp.integrate(x[0], x[-1]).shape == (2,)
+
+def test_nu_validation(data):
+    x, y = data
+    interp = pchips.PchipInterpolator(x, y)
+    with pytest.raises(ValueError):
+        interp(x, nu=-1)
+    with pytest.raises(ValueError):
+        interp.antiderivative(0.5)
+
+
+def test_derived_interpolants_are_not_fits(data):
+    x, y = data
+    interp = pchips.PchipInterpolator(x, y)
+    for derived in (interp.derivative(), interp.derivative(0), interp.antiderivative()):
+        assert derived.approx_order is None and derived.mono_constraint is None
+        with pytest.raises(ValueError):
+            derived.compress(1e-3)
@@ -0,0 +1,68 @@
+import numpy as np
+import pytest
+import pchips
+
+@pytest.fixture(scope="module")
+def interp():
+    rng = np.random.default_rng(0)
+    x = np.cumsum(rng.uniform(0.1, 2.0, 60))
+    return pchips.PchipInterpolator(x, np.sin(x / 5), approx_order='quartic', mono_constraint='M4')
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 1000, None])
+def test_chunked_matches_direct_call(interp, chunk_size):
+    u = np.random.default_rng(1).uniform(interp.x[0] - 2, interp.x[-1] + 2, (37, 11))
+    out = np.empty_like(u)
+    result = interp(u, out=out, chunk_size=chunk_size)
+    assert result is out
+    np.testing.assert_array_equal(out, interp(u))
+    np.testing.assert_array_equal(interp(u, chunk_size=chunk_size), interp(u))
+
+    u_sorted = np.sort(u.ravel())
+    np.testing.assert_array_equal(interp(u_sorted, assume_sorted=True, chunk_size=chunk_size), interp(u_sorted))
+    plan = pchips.QueryPlan(interp.x, u)
+    np.testing.assert_array_equal(interp(plan, chunk_size=chunk_size), interp(u))
+
+def test_chunked_memmap(interp, tmp_path):
+    size = 100_003
+    u = np.lib.format.open_memmap(tmp_path / "u.npy", mode='w+', dtype=np.float64, shape=(size,))
+    u[:] = np.linspace(interp.x[0], interp.x[-1], size)
+    out = np.lib.format.open_memmap(tmp_path / "out.npy", mode='w+', dtype=np.float32, shape=(size,))
+    interp(u, out=out, chunk_size=4096)
+    out.flush()
+    np.testing.assert_array_equal(np.load(tmp_path / "out.npy"), interp(np.asarray(u)).astype(np.float32))
+
+def test_chunked_batch_axis():
+    rng = np.random.default_rng(2)
+    x = np.linspace(0, 10, 20)
+    y = rng.normal(size=(3, 20))
+    interp = pchips.PchipInterpolator(x, y, axis=1)
+    u = rng.uniform(-1, 11, 101)
+    out = np.empty((3, 101))
+    interp(u, out=out, chunk_size=16)
+    np.testing.assert_array_equal(out, interp(u))
+    with pytest.raises(ValueError):
+        interp(u, out=np.empty((101, 3)))
+
+@pytest.mark.parametrize("workers", [1, 3])
+def test_threaded_matches_direct_call(interp, workers):
+    u = np.random.default_rng(3).uniform(interp.x[0] - 2, interp.x[-1] + 2, 10_001)
+    np.testing.assert_array_equal(interp(u, workers=workers, chunk_size=512), interp(u))
+    out = np.empty_like(u)
+    interp(u, out=out, workers=workers, chunk_size=999)
+    np.testing.assert_array_equal(out, interp(u))
+
+
+@pytest.mark.parametrize("dtype", [np.int64, np.int32, np.float32])
+def test_chunked_non_float64_knots(dtype):
+    x = np.arange(0, 40, 2).astype(dtype)
+    interp = pchips.PchipInterpolator(x, np.sin(x * 1.0))
+    assert interp.x.dtype == np.float64
+    u = np.linspace(-1, 41, 10)
+    np.testing.assert_array_equal(interp(u, chunk_size=4), interp(u))
+    np.testing.assert_array_equal(interp(u, workers=2, chunk_size=3), interp(u))
+    np.testing.assert_allclose(interp(u), pchips.PchipInterpolator(x.astype(float), np.sin(x * 1.0))(u))
+
+def test_chunked_rejects_integer_out(interp):
+    u = np.linspace(interp.x[0], interp.x[-1], 50)
+    with pytest.raises(TypeError):
+        interp(u, out=np.empty(50, dtype=np.int64))
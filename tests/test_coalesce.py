@@ -0,0 +1,131 @@
+import asyncio
+import gc
+import threading
+import weakref
+
+import numpy as np
+import pytest
+import pchips
+
+@pytest.fixture(scope="module")
+def interp():
+    rng = np.random.default_rng(0)
+    x = np.cumsum(rng.uniform(0.1, 2.0, 100))
+    return pchips.PchipInterpolator(x, np.sin(x / 5))
+
+def test_threads_get_their_own_results(interp):
+    rng = np.random.default_rng(1)
+    requests = [float(v) for v in rng.uniform(-5, 200, 200)] + \
+               [rng.uniform(-5, 200, size) for size in [(3,), (2, 4), (0,), (1,)]] + \
+               [rng.uniform(0, 100, 5).astype(np.float32), 7, np.float32(3.5)]
+    results = [None] * len(requests)
+    with pchips.CoalescingEvaluator(interp, max_batch=64, max_delay=1e-3) as evaluator:
+        def work(k):
+            results[k] = evaluator(requests[k])
+        threads = [threading.Thread(target=work, args=(k,)) for k in range(len(requests))]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        metrics = evaluator.metrics()
+
+    for u, result in zip(requests, results):
+        expected = interp(u)
+        if isinstance(u, np.ndarray) and u.dtype == np.float32:
+            assert result.dtype == np.float32
+        assert np.shape(result) == np.shape(expected)
+        assert type(result) is type(expected)
+        np.testing.assert_array_equal(result, expected)
+
+    assert metrics['requests'] == len(requests)
+    assert metrics['queries'] == sum(np.size(u) for u in requests)
+    assert metrics['max_batch_size'] <= 64
+    assert metrics['batches'] < len(requests)
+    assert 0 <= metrics['latency_p50'] <= metrics['latency_p99'] <= metrics['latency_max']
+
+def test_asyncio(interp):
+    async def main(evaluator):
+        u = np.linspace(-1, 150, 500)
+        scalars = await asyncio.gather(*[evaluator.evaluate_async(float(v)) for v in u])
+        array = await evaluator.evaluate_async(u.reshape(20, 25))
+        return u, scalars, array
+
+    with pchips.CoalescingEvaluator(interp, max_batch=128) as evaluator:
+        u, scalars, array = asyncio.run(main(evaluator))
+        metrics = evaluator.metrics()
+    np.testing.assert_array_equal(scalars, interp(u))
+    np.testing.assert_array_equal(array, interp(u.reshape(20, 25)))
+    assert metrics['batches'] <= 10 and metrics['max_batch_size'] <= 500
+
+def test_columns_axis_and_derivative():
+    x = np.linspace(0, 10, 30)
+    interp = pchips.PchipInterpolator(x, np.stack([np.sin(x), np.cos(x), x]), axis=1)
+    u = np.array([[0.5, 2.0], [11.0, -1.0]])
+    with pchips.CoalescingEvaluator(interp, max_delay=0) as evaluator:
+        futures = [evaluator.submit(u), evaluator.submit(3.0), evaluator.submit(u[0])]
+        results = [future.result() for future in futures]
+    np.testing.assert_array_equal(results[0], interp(u))
+    np.testing.assert_array_equal(results[1], interp(3.0))
+    np.testing.assert_array_equal(results[2], interp(u[0]))
+
+    with pchips.CoalescingEvaluator(interp, nu=1) as evaluator:
+        np.testing.assert_array_equal(evaluator(u), interp(u, nu=1))
+
+def test_errors_and_close(interp):
+    with pytest.raises(ValueError):
+        pchips.CoalescingEvaluator(interp, max_batch=0)
+    with pytest.raises(ValueError):
+        pchips.CoalescingEvaluator(interp, max_delay=-1)
+
+    evaluator = pchips.CoalescingEvaluator(interp, max_delay=10.0)
+    pending = [evaluator.submit(float(v)) for v in range(5)]
+    # Closing flushes the open window rather than waiting it out.
+    evaluator.close()
+    assert [f.result(timeout=1) for f in pending] == list(interp(np.arange(5.0)))
+    with pytest.raises(RuntimeError):
+        evaluator.submit(1.0)
+
+    with pchips.CoalescingEvaluator(interp) as evaluator:
+        with pytest.raises(ValueError):
+            evaluator(np.array(['a']))
+
+
+def test_cancelled_requests_are_skipped(interp):
+    with pchips.CoalescingEvaluator(interp, max_batch=4, max_delay=10.0) as evaluator:
+        futures = [evaluator.submit(float(v)) for v in range(3)]
+        assert futures[1].cancel()
+        # Filling the batch dispatches it without waiting out the window.
+        rest = evaluator.submit(np.arange(3.0, 7.0))
+        assert futures[0].result(timeout=5) == interp(0.0)
+        assert futures[2].result(timeout=5) == interp(2.0)
+        np.testing.assert_array_equal(rest.result(timeout=5), interp(np.arange(3.0, 7.0)))
+        assert futures[1].cancelled()
+        assert evaluator._thread.is_alive()
+        assert evaluator.metrics()['requests'] == 3
+
+    async def main(evaluator):
+        task = asyncio.ensure_future(evaluator.evaluate_async(1.0))
+        await asyncio.sleep(0)
+        task.cancel()
+        return await evaluator.evaluate_async(2.0)
+
+    with pchips.CoalescingEvaluator(interp, max_delay=0.05) as evaluator:
+        assert asyncio.run(main(evaluator)) == interp(2.0)
+
+
+def test_dropped_evaluator_is_collected(interp):
+    evaluator = pchips.CoalescingEvaluator(interp, max_delay=0.05)
+    thread, ref = evaluator._thread, weakref.ref(evaluator)
+    future = evaluator.submit(1.0)
+    del evaluator
+    # Queued requests are still served, then the thread lets go and stops.
+    assert future.result(timeout=5) == interp(1.0)
+    thread.join(timeout=5)
+    gc.collect()
+    assert ref() is None and not thread.is_alive()
+
+    evaluator = pchips.CoalescingEvaluator(interp)
+    thread = evaluator._thread
+    del evaluator
+    thread.join(timeout=5)
+    assert not thread.is_alive()
@@ -0,0 +1,78 @@
+import numpy as np
+import pytest
+import pchips
+
+CONFIGURATIONS = [
+    {'approx_order': 'cubic', 'mono_constraint': 'M4'},
+    {'approx_order': 'cubic', 'mono_constraint': 'M3'},
+    {'approx_order': 'quartic', 'mono_constraint': 'M4'},
+    {'approx_order': 'quartic', 'mono_constraint': 'M3'},
+]
+
+@pytest.mark.parametrize("config", CONFIGURATIONS)
+@pytest.mark.parametrize("tol", [1e-4, 1e-8])
+def test_compress_within_tolerance(config, tol):
+    x = np.linspace(0.0, 10.0, 20001)
+    y = np.sin(x) + 0.1 * x
+    interp = pchips.PchipInterpolator(x, y, **config)
+    reduced, info = interp.compress(tol)
+
+    assert set(reduced.x) <= set(x)
+    assert (reduced.approx_order, reduced.mono_constraint) == (config['approx_order'], config['mono_constraint'])
+    assert info['n_original'] == len(x) and info['n_compressed'] == reduced.n
+    assert info['ratio'] == len(x) / reduced.n > 10
+    assert info['max_error'] <= tol
+    np.testing.assert_allclose(reduced(x), y, rtol=0, atol=tol)
+    mid = 0.5 * (x[:-1] + x[1:])
+    np.testing.assert_allclose(reduced(mid), interp(mid), rtol=0, atol=tol)
+
+def test_compress_keeps_monotone_pieces():
+    rng = np.random.default_rng(0)
+    x = np.sort(rng.uniform(0, 1, 5000))
+    # Increasing with flat plateaus, then decreasing.
+    y = np.concatenate([np.cumsum(rng.uniform(0, 1, 2500) * (rng.uniform(size=2500) < 0.01)),
+                        np.linspace(30, 0, 2500)])
+    interp = pchips.PchipInterpolator(x, y)
+    reduced, info = interp.compress(1e-6)
+    assert info['max_error'] <= 1e-6
+
+    u = np.linspace(x[0], x[-1], 200001)
+    slopes = np.diff(reduced(u))
+    peak = x[2499]
+    assert np.all(slopes[u[1:] <= peak] >= -1e-12)
+    assert np.all(slopes[u[:-1] >= x[2500]] <= 1e-12)
+
+def test_compress_columns_and_axis():
+    x = np.linspace(-1.0, 1.0, 3001)
+    y = np.stack([np.exp(x), np.tanh(3 * x)])
+    interp = pchips.PchipInterpolator(x, y, axis=1)
+    reduced, info = interp.compress(1e-7)
+    assert reduced.axis == 1 and reduced.y.shape[1] == 2
+    np.testing.assert_allclose(reduced(x), y, rtol=0, atol=1e-7)
+
+    exact, info = interp.compress(0.0)
+    assert info['max_error'] == 0.0
+
+    with pytest.raises(ValueError):
+        interp.compress(-1.0)
+
+
+def test_compress_stops_when_tol_is_out_of_reach():
+    rng = np.random.default_rng(0)
+    x = np.sort(rng.uniform(0, 10, 30))
+    interp = pchips.PchipInterpolator(x, 1e3 * rng.uniform(size=30))
+    reduced, info = interp.compress(1e-14)
+    assert reduced.n == info['n_compressed'] == 30
+    np.testing.assert_array_equal(reduced.coeffs, interp.coeffs)
+    assert info['max_error'] < 1e-9
+
+def test_compress_keeps_storage():
+    x = np.linspace(0.0, 10.0, 2001)
+    interp = pchips.PchipInterpolator(x, np.sin(x), dtype=np.float32, layout='columns')
+    reduced, info = interp.compress(1e-5)
+    assert reduced.coeffs.dtype == np.float32 and reduced._layout == 'columns'
+    assert not reduced.coeffs.flags.c_contiguous
+    assert info['max_error'] <= 1e-5 and reduced.n < len(x) / 10
+    # Below float32 resolution it ends at the full knot set, matching the original.
+    reduced, info = interp.compress(1e-9)
+    np.testing.assert_array_equal(reduced.coeffs, interp.coeffs)
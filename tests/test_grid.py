@@ -0,0 +1,79 @@
+import numpy as np
+import pytest
+import pchips
+import scipy.interpolate as interpolate
+
+CONFIGURATIONS = [
+    {'approx_order': 'cubic', 'mono_constraint': 'M4'},
+    {'approx_order': 'cubic', 'mono_constraint': 'M3'},
+    {'approx_order': 'quartic', 'mono_constraint': 'M4'},
+    {'approx_order': 'quartic', 'mono_constraint': 'M3'},
+]
+
+@pytest.fixture(scope="module")
+def grid():
+    rng = np.random.default_rng(0)
+    x = np.cumsum(rng.uniform(0.1, 1.0, 12))
+    y = np.cumsum(rng.uniform(0.1, 1.0, 9))
+    values = np.sin(x)[:, None] * np.cos(y)[None, :] + np.sqrt(x)[:, None]
+    return x, y, values
+
+@pytest.mark.parametrize("config", CONFIGURATIONS)
+def test_grid_lines_match_1d(grid, config):
+    x, y, values = grid
+    interp = pchips.PchipGridInterpolator((x, y), values, **config)
+    assert interp.coeffs.shape == (len(x) - 1, len(y) - 1, 4, 4)
+
+    nodes = np.stack(np.meshgrid(x, y, indexing='ij'), axis=-1)
+    np.testing.assert_allclose(interp(nodes), values, rtol=0, atol=1e-13)
+
+    u = np.linspace(x[0] - 1, x[-1] + 1, 201)
+    w = np.linspace(y[0] - 1, y[-1] + 1, 201)
+    for j in [0, 4, len(y) - 1]:
+        line = pchips.PchipInterpolator(x, values[:, j], **config)
+        np.testing.assert_allclose(interp(np.column_stack([u, np.full_like(u, y[j])])), line(u),
+                                   rtol=1e-13, atol=1e-13)
+    for i in [0, 5, len(x) - 1]:
+        line = pchips.PchipInterpolator(y, values[i], **config)
+        np.testing.assert_allclose(interp(np.column_stack([np.full_like(w, x[i]), w])), line(w),
+                                   rtol=1e-13, atol=1e-13)
+
+@pytest.mark.parametrize("config", CONFIGURATIONS)
+def test_multilinear_is_exact(config):
+    axes = (np.linspace(0.0, 2.0, 6), np.array([0.0, 0.3, 0.5, 1.2, 1.4, 2.0]), np.linspace(-1.0, 1.0, 7))
+    f = lambda a, b, c: 1 + 2*a - 3*b + 0.5*c + a*b - 2*a*b*c
+    interp = pchips.PchipGridInterpolator(axes, f(*np.meshgrid(*axes, indexing='ij')), **config)
+    rng = np.random.default_rng(1)
+    u = rng.uniform([0, 0, -1], [2, 2, 1], (20, 50, 3))
+    result = interp(u)
+    assert result.shape == (20, 50)
+    np.testing.assert_allclose(result, f(*np.moveaxis(u, -1, 0)), rtol=1e-12, atol=1e-12)
+
+def test_close_to_scipy_cubic():
+    a = np.linspace(0.0, 1.0, 40)
+    b = np.linspace(0.0, 2.0, 60)
+    values = np.exp(-a)[:, None] * np.sin(3 * b)[None, :]
+    u = np.random.default_rng(2).uniform([0, 0], [1, 2], (1000, 2))
+    ours = pchips.PchipGridInterpolator((a, b), values)(u)
+    scipy_cubic = interpolate.RegularGridInterpolator((a, b), values, method='cubic')(u)
+    np.testing.assert_allclose(ours, scipy_cubic, rtol=0, atol=1e-4)
+    np.testing.assert_allclose(ours, np.exp(-u[:, 0]) * np.sin(3 * u[:, 1]), rtol=0, atol=1e-4)
+
+def test_one_dimensional_grid(grid):
+    x, _, values = grid
+    interp = pchips.PchipGridInterpolator((x,), values[:, 2])
+    u = np.linspace(x[0] - 1, x[-1] + 1, 101)
+    np.testing.assert_allclose(interp(u[:, None]), pchips.PchipInterpolator(x, values[:, 2])(u),
+                               rtol=1e-13, atol=1e-13)
+
+def test_validation(grid):
+    x, y, values = grid
+    with pytest.raises(ValueError):
+        pchips.PchipGridInterpolator((x, y), values.T)
+    with pytest.raises(ValueError):
+        pchips.PchipGridInterpolator((x, y[::-1]), values)
+    with pytest.raises(ValueError):
+        pchips.PchipGridInterpolator((x[:4], y), values[:4])
+    interp = pchips.PchipGridInterpolator((x, y), values)
+    with pytest.raises(ValueError):
+        interp(np.zeros((5, 3)))
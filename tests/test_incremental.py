@@ -0,0 +1,98 @@
+import numpy as np
+import pytest
+import pchips
+
+CONFIGURATIONS = [
+    {'approx_order': 'cubic', 'mono_constraint': 'M4'},
+    {'approx_order': 'cubic', 'mono_constraint': 'M3'},
+    {'approx_order': 'quartic', 'mono_constraint': 'M4'},
+    {'approx_order': 'quartic', 'mono_constraint': 'M3'},
+]
+
+@pytest.fixture(scope="module")
+def series():
+    rng = np.random.default_rng(0)
+    x = np.cumsum(rng.uniform(0.1, 2.0, 60))
+    y = np.cumsum(rng.normal(size=60))
+    return x, y
+
+@pytest.mark.parametrize("config", CONFIGURATIONS)
+def test_append_matches_refit(series, config):
+    x, y = series
+    interp = pchips.PchipInterpolator(x[:5], y[:5], **config)
+    for n in range(6, len(x) + 1):
+        interp.append(x[n-1], y[n-1])
+        np.testing.assert_array_equal(interp.coeffs, pchips.PchipInterpolator(x[:n], y[:n], **config).coeffs)
+
+    interp = pchips.PchipInterpolator(x[:20], y[:20], **config)
+    interp.append(x[20:23], y[20:23])
+    interp.append(x[23:], y[23:])
+    full = pchips.PchipInterpolator(x, y, **config)
+    np.testing.assert_array_equal(interp.coeffs, full.coeffs)
+    u = np.linspace(x[0] - 1, x[-1] + 1, 301)
+    np.testing.assert_array_equal(interp(u), full(u))
+    np.testing.assert_array_equal(interp.integrate(x[0], u), full.integrate(x[0], u))
+
+@pytest.mark.parametrize("config", CONFIGURATIONS)
+def test_update_matches_refit(series, config):
+    x, y = series
+    y = y.copy()
+    interp = pchips.PchipInterpolator(x, y, **config)
+    rng = np.random.default_rng(1)
+    for i in list(range(len(x))) + [-1, -7]:
+        y[i] = rng.normal()
+        interp.update(i, y[i])
+        np.testing.assert_array_equal(interp.coeffs, pchips.PchipInterpolator(x, y, **config).coeffs)
+
+def test_derivative_tables_follow_changes(series):
+    x, y = series
+    y = y.copy()
+    interp = pchips.PchipInterpolator(x[:40], y[:40])
+    u = np.linspace(x[0], x[-1], 301)
+    interp(u, nu=1)
+    interp.append(x[40:], y[40:])
+    np.testing.assert_array_equal(interp(u, nu=1), pchips.PchipInterpolator(x, y)(u, nu=1))
+    y[10] = 5.0
+    interp.update(10, y[10])
+    np.testing.assert_array_equal(interp(u, nu=2), pchips.PchipInterpolator(x, y)(u, nu=2))
+    np.testing.assert_array_equal(interp(u, nu=1), pchips.PchipInterpolator(x, y)(u, nu=1))
+
+def test_two_dimensional_and_loaded(series, tmp_path):
+    x, y = series
+    y2 = np.stack([y, np.sin(x)])
+    interp = pchips.PchipInterpolator(x[:30], y2[:, :30], axis=1)
+    interp.append(x[30], y2[:, 30])
+    interp.append(x[31:], y2[:, 31:])
+    np.testing.assert_array_equal(interp.coeffs, pchips.PchipInterpolator(x, y2, axis=1).coeffs)
+
+    path = tmp_path / "series.pchips"
+    pchips.PchipInterpolator(x[:30], y[:30]).save(path)
+    loaded = pchips.PchipInterpolator.load(path)
+    loaded.update(3, 0.5)
+    loaded.append(x[30:], y[30:])
+    expected = y.copy()
+    expected[3] = 0.5
+    np.testing.assert_array_equal(loaded.coeffs, pchips.PchipInterpolator(x, expected).coeffs)
+
+def test_append_keeps_grid_lookup():
+    x = np.arange(10.0)
+    interp = pchips.PchipInterpolator(x, np.sqrt(x))
+    interp.append(10.1, np.sqrt(10.1))
+    assert interp._step == 1.0
+    interp.append(12.0, 3.0)
+    assert interp._step is None
+
+def test_validation(series):
+    x, y = series
+    interp = pchips.PchipInterpolator(x[:10], y[:10])
+    with pytest.raises(ValueError):
+        interp.append(x[9], 0.0)
+    with pytest.raises(ValueError):
+        interp.append(x[10:12], y[10:13])
+    with pytest.raises(ValueError):
+        interp.append(np.inf, 0.0)
+    with pytest.raises(IndexError):
+        interp.update(10, 0.0)
+    with pytest.raises(ValueError):
+        interp.update(0, [1.0, 2.0])
+    np.testing.assert_array_equal(interp.coeffs, pchips.PchipInterpolator(x[:10], y[:10]).coeffs)
@@ -0,0 +1,39 @@
+import numpy as np
+import pytest
+import pchips
+from pathlib import Path
+
+CONFIGURATIONS = [
+    {'approx_order': 'cubic', 'mono_constraint': 'M4'},
+    {'approx_order': 'cubic', 'mono_constraint': 'M3'},
+    {'approx_order': 'quartic', 'mono_constraint': 'M4'},
+    {'approx_order': 'quartic', 'mono_constraint': 'M3'},
+]
+
+@pytest.fixture(scope="module")
+def rpn14_data():
+    data_path = Path(__file__).parent.joinpath("../data").resolve().joinpath("rpn14_data.csv")
+    data = np.genfromtxt(data_path, delimiter=',', names=True)
+    return data['x'], data['y']
+
+@pytest.mark.parametrize("config", CONFIGURATIONS)
+@pytest.mark.parametrize("sign", [1, -1])
+def test_inverse_roundtrip(rpn14_data, config, sign):
+    x, y = rpn14_data
+    interp = pchips.PchipInterpolator(x, sign * y, **config)
+
+    # On the steep part of the curve the preimage is well conditioned.
+    u = np.linspace(x[1], 10.0, 2001)
+    np.testing.assert_allclose(interp.inverse(interp(u)), u, rtol=1e-9)
+
+    w = sign * np.linspace(y[0], y[-1], 999).reshape(37, 27)
+    np.testing.assert_allclose(interp(interp.inverse(w)), w, rtol=1e-12, atol=1e-15)
+    np.testing.assert_array_equal(interp.inverse(sign * y), x)
+    assert np.isnan(interp.inverse(sign * 2.0))
+
+def test_inverse_requires_monotone_data():
+    x = np.linspace(0, 1, 10)
+    with pytest.raises(ValueError):
+        pchips.PchipInterpolator(x, np.sin(3 * x)).inverse(0.5)
+    with pytest.raises(ValueError):
+        pchips.PchipInterpolator(x, np.minimum(x, 0.5)).inverse(0.25)
@@ -0,0 +1,55 @@
+import numpy as np
+import pytest
+import pchips
+
+CONFIGURATIONS = [
+    {'approx_order': 'cubic', 'mono_constraint': 'M4'},
+    {'approx_order': 'quartic', 'mono_constraint': 'M3'},
+]
+
+@pytest.mark.parametrize("mmap", [True, False])
+@pytest.mark.parametrize("config", CONFIGURATIONS)
+def test_roundtrip(tmp_path, config, mmap):
+    rng = np.random.default_rng(0)
+    x = np.cumsum(rng.uniform(0.1, 2.0, 40))
+    y = rng.normal(size=(3, 40))
+    interp = pchips.PchipInterpolator(x, y, axis=np.int64(1), **config)
+    assert type(interp.axis) is int
+    path = tmp_path / "curve.pchips"
+    interp.save(path)
+
+    loaded = pchips.PchipInterpolator.load(path, mmap=mmap)
+    assert (loaded.approx_order, loaded.mono_constraint, loaded.axis) == (interp.approx_order, interp.mono_constraint, 1)
+    assert loaded.coeffs.flags.writeable != mmap
+    np.testing.assert_array_equal(loaded.coeffs, interp.coeffs)
+    u = rng.uniform(x[0] - 1, x[-1] + 1, 500)
+    np.testing.assert_array_equal(loaded(u), interp(u))
+
+def test_load_does_not_refit(tmp_path, monkeypatch):
+    x = np.linspace(0, 1, 11)
+    interp = pchips.PchipInterpolator(x, x**2)
+    interp.save(tmp_path / "curve.pchips")
+    monkeypatch.setattr(pchips.PchipInterpolator, "_fit", lambda self: pytest.fail("refit on load"))
+    loaded = pchips.PchipInterpolator.load(tmp_path / "curve.pchips")
+    assert loaded._step is not None
+    assert loaded(0.25) == interp(0.25)
+
+def test_batch_roundtrip(tmp_path):
+    rng = np.random.default_rng(1)
+    curves = [(np.cumsum(rng.uniform(0.1, 1.0, n)), rng.normal(size=n)) for n in [5, 9, 17]]
+    batch = pchips.PchipBatch.from_curves(curves, mono_constraint='M4')
+    batch.save(tmp_path / "batch.pchips")
+    loaded = pchips.PchipBatch.load(tmp_path / "batch.pchips")
+    ids = rng.integers(0, 3, 200)
+    u = rng.uniform(0, 10, 200)
+    np.testing.assert_array_equal(loaded(ids, u), batch(ids, u))
+
+def test_rejects_other_files(tmp_path):
+    path = tmp_path / "other.npy"
+    np.save(path, np.zeros(3))
+    with pytest.raises(ValueError):
+        pchips.PchipInterpolator.load(path)
+    x = np.linspace(0, 1, 11)
+    pchips.PchipInterpolator(x, x).save(tmp_path / "curve.pchips")
+    with pytest.raises(ValueError):
+        pchips.PchipBatch.load(tmp_path / "curve.pchips")
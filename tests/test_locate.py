@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+import pchips
+from pchips.interpolate import _locate
+
+def searchsorted_indices(x, u):
+    return np.clip(np.searchsorted(x, u, side='right') - 1, 0, len(x) - 2)
+
+@pytest.fixture(scope="module")
+def grids():
+    rng = np.random.default_rng(0)
+    return {
+        'uniform': np.linspace(-3.0, 7.0, 41),
+        'jittered': np.linspace(0.0, 1.0, 101) + rng.uniform(-2e-3, 2e-3, 101),
+        'irregular': np.cumsum(rng.uniform(0.1, 2.0, 50)),
+    }
+
+def queries(x):
+    rng = np.random.default_rng(1)
+    return np.concatenate([
+        rng.uniform(x[0] - 1, x[-1] + 1, 2000),
+        x,
+        np.nextafter(x, -np.inf),
+        np.nextafter(x, np.inf),
+    ])
+
+@pytest.mark.parametrize("name", ['uniform', 'jittered', 'irregular'])
+def test_fast_paths_match_searchsorted(grids, name):
+    x = grids[name]
+    interp = pchips.PchipInterpolator(x, np.sin(x))
+    assert (interp._step is not None) == (name != 'irregular')
+
+    u = queries(x)
+    expected = searchsorted_indices(x, u)
+    np.testing.assert_array_equal(_locate(x, u, interp._step), expected)
+
+    u_sorted = np.sort(u)
+    np.testing.assert_array_equal(_locate(x, u_sorted, assume_sorted=True), searchsorted_indices(x, u_sorted))
+    np.testing.assert_array_equal(interp(u_sorted, assume_sorted=True), interp(u_sorted))
+
+def test_sorted_path_keeps_query_shape(grids):
+    x = grids['uniform']
+    interp = pchips.PchipInterpolator(x, np.column_stack([np.sin(x), np.cos(x)]))
+    u = np.linspace(x[0], x[-1], 24).reshape(4, 6)
+    np.testing.assert_array_equal(interp(u, assume_sorted=True), interp(u))
+
+
+@pytest.mark.parametrize("name", ['uniform', 'irregular'])
+def test_sorted_path_narrow_ranges(grids, name):
+    x = grids[name]
+    u = np.sort(queries(x))
+    for sub in (u[:0], u[:1], u[-1:], u[900:910], u[:5], u[-5:], x[3:9]):
+        np.testing.assert_array_equal(_locate(x, sub, assume_sorted=True), searchsorted_indices(x, sub))
@@ -0,0 +1,59 @@
+import numpy as np
+import pytest
+import pchips
+
+@pytest.fixture(scope="module")
+def curves():
+    rng = np.random.default_rng(0)
+    x = np.cumsum(rng.uniform(0.1, 2.0, 30))
+    y = np.cumsum(rng.uniform(-1.0, 1.0, (30, 8)), axis=0)
+    return x, y
+
+def test_plan_matches_direct_call(curves):
+    x, y = curves
+    u = np.random.default_rng(1).uniform(x[0] - 1, x[-1] + 1, (50, 7))
+    plan = pchips.QueryPlan(x, u)
+    for j in range(y.shape[1]):
+        interp = pchips.PchipInterpolator(x, y[:, j], mono_constraint='M4')
+        np.testing.assert_array_equal(interp(plan), interp(u))
+
+    interp = pchips.PchipInterpolator(x, y.T, axis=1)
+    np.testing.assert_array_equal(interp(plan), interp(u))
+
+def test_plan_evaluates_stacked_tables(curves):
+    x, y = curves
+    u = np.linspace(x[0] - 1, x[-1] + 1, 333)
+    plan = pchips.QueryPlan(x, u, assume_sorted=True)
+    interps = [pchips.PchipInterpolator(x, y[:, j]) for j in range(y.shape[1])]
+    values = plan.evaluate(np.stack([interp.coeffs for interp in interps]))
+    assert values.shape == (len(interps), len(u))
+    for interp, v in zip(interps, values):
+        np.testing.assert_allclose(v, interp(u), rtol=1e-12, atol=1e-12)
+
+def test_plan_rejects_other_knots(curves):
+    x, y = curves
+    plan = pchips.QueryPlan(x, np.linspace(x[0], x[-1], 10))
+    interp = pchips.PchipInterpolator(x * 2, y[:, 0])
+    with pytest.raises(ValueError):
+        interp(plan)
+    with pytest.raises(ValueError):
+        plan.evaluate(interp.coeffs[:-1])
+
+
+def test_plan_checks_each_knot_array_once(curves, monkeypatch):
+    x, y = curves
+    u = np.linspace(x[0], x[-1], 10)
+    plan = pchips.QueryPlan(x, u)
+    interp = pchips.PchipInterpolator(x, y[:, 0])
+    expected = interp(plan)
+    calls = []
+    array_equal = np.array_equal
+    monkeypatch.setattr(np, 'array_equal', lambda *args: calls.append(1) or array_equal(*args))
+    for _ in range(3):
+        np.testing.assert_array_equal(interp(plan), expected)
+    assert not calls
+    # Appending moves the knots to a new array, which is checked afresh.
+    interp.append(x[-1] + 1, 0.0)
+    with pytest.raises(ValueError):
+        interp(plan)
+    assert len(calls) == 1
@@ -0,0 +1,81 @@
+import tracemalloc
+
+import numpy as np
+import pytest
+import pchips
+
+CONFIGURATIONS = [
+    {'approx_order': 'cubic', 'mono_constraint': 'M4'},
+    {'approx_order': 'cubic', 'mono_constraint': 'M3'},
+    {'approx_order': 'quartic', 'mono_constraint': 'M4'},
+    {'approx_order': 'quartic', 'mono_constraint': 'M3'},
+]
+
+STAGES = ['validate', 'vecdiffs', 'approxder', 'perturbder', 'compute_coeffs']
+
+@pytest.fixture(scope="module")
+def data():
+    rng = np.random.default_rng(0)
+    x = np.cumsum(rng.uniform(0.1, 2.0, 200))
+    # Flat stretches and jumps make the constraint clip.
+    y = np.cumsum(rng.uniform(0, 1, 200) * (rng.uniform(size=200) < 0.3))
+    return x, y
+
+@pytest.mark.parametrize("config", CONFIGURATIONS)
+def test_profile_records_fit(data, config):
+    x, y = data
+    interp = pchips.PchipInterpolator(x, y, profile=True, **config)
+    plain = pchips.PchipInterpolator(x, y, **config)
+    assert plain.profile is None
+    np.testing.assert_array_equal(interp.coeffs, plain.coeffs)
+
+    profile = interp.profile
+    assert list(profile.stages) == STAGES
+    for stage in profile.stages.values():
+        assert stage['seconds'] >= 0 and stage['peak'] >= 0
+    assert profile.stages['compute_coeffs']['allocated'] >= interp.coeffs.nbytes
+
+    # Recount the clipped estimates from the stages run by hand.
+    s, ds, e, f = plain._vecdiffs()
+    d = plain._approxder(s, ds, e, f)
+    changed = plain._perturbder(d, s, ds, e) != d
+    boundary = [0, 1, len(x) - 2, len(x) - 1]
+    if config['mono_constraint'] == 'M4':
+        boundary += [2, len(x) - 3]
+    interior = np.delete(changed, boundary)
+    clipped = profile.clipped[config['mono_constraint']]
+    assert clipped == {'boundary': int(changed[boundary].sum()), 'interior': int(interior.sum())}
+    assert clipped['interior'] > 0
+    assert profile.estimates == {'boundary': len(boundary), 'interior': len(x) - len(boundary)}
+
+def test_profile_records_calls(data):
+    x, y = data
+    interp = pchips.PchipInterpolator(x, np.column_stack([y, -y]), profile=True)
+    u = np.linspace(x[0], x[-1], 1000)
+    interp(u)
+    interp(u[0])
+    interp(u, out=np.empty((1000, 2)))
+    assert [call['queries'] for call in interp.profile.calls] == [1000, 1, 1000]
+    assert all(call['seconds'] >= 0 for call in interp.profile.calls)
+    assert sum(interp.profile.estimates.values()) == 2 * len(x)
+
+def test_profile_on_failed_validation():
+    with pytest.raises(ValueError):
+        pchips.PchipInterpolator(np.ones(5), np.ones(5), profile=True)
+    assert not tracemalloc.is_tracing()
+
+def test_profile_leaves_callers_tracing_alone(data):
+    x, y = data
+    tracemalloc.start()
+    try:
+        block = np.ones(1 << 20)
+        del block
+        peak = tracemalloc.get_traced_memory()[1]
+        interp = pchips.PchipInterpolator(x, y, profile=True)
+        assert tracemalloc.is_tracing()
+        assert tracemalloc.get_traced_memory()[1] >= peak >= 8 << 20
+    finally:
+        tracemalloc.stop()
+    for stage in interp.profile.stages.values():
+        assert stage['peak'] is None and stage['seconds'] >= 0
+    assert interp.profile.stages['compute_coeffs']['allocated'] >= interp.coeffs.nbytes
@@ -0,0 +1,124 @@
+import numpy as np
+import pytest
+import pchips
+from pathlib import Path
+
+CONFIGURATIONS = [
+    {'approx_order': 'cubic', 'mono_constraint': 'M4'},
+    {'approx_order': 'cubic', 'mono_constraint': 'M3'},
+    {'approx_order': 'quartic', 'mono_constraint': 'M4'},
+    {'approx_order': 'quartic', 'mono_constraint': 'M3'},
+]
+
+DATASETS = ["akima", "hyman", "moler", "rpn14", "titanium"]
+
+
+class LoopPchipInterpolator(pchips.PchipInterpolator):
+    """The original per-knot formulation of the fit, kept as a reference."""
+
+    def _approxder(self, s, ds, e, f):
+        d = np.zeros(self.n)
+
+        if self.approx_order == 'cubic':
+            for k in range(self.n - 3):
+                d[k] = s[k] + ds[k]*(self.x[k] - self.x[k+1]) + \
+                       e[k]*(self.x[k]**2 + self.x[k+1]*self.x[k+2] - self.x[k]*self.x[k+1] - self.x[k]*self.x[k+2])
+            w1 = 3*e[self.n-4]
+            w2 = 2*(ds[self.n-4] - e[self.n-4]*(self.x[self.n-4] + self.x[self.n-3] + self.x[self.n-2]))
+            rest = s[self.n-4] - ds[self.n-4]*(self.x[self.n-4] + self.x[self.n-3]) + \
+                   e[self.n-4]*(self.x[self.n-4]*self.x[self.n-3] + self.x[self.n-4]*self.x[self.n-2] + self.x[self.n-3]*self.x[self.n-2])
+            for k in range(self.n - 3, self.n):
+                 d[k] = w1*self.x[k]**2 + w2*self.x[k] + rest
+        elif self.approx_order == 'quartic':
+            for k in range(self.n - 4):
+                d[k] = s[k] + ds[k]*(self.x[k] - self.x[k+1]) + \
+                       e[k]*(self.x[k]*(self.x[k] - self.x[k+1] - self.x[k+2]) + self.x[k+1]*self.x[k+2]) + \
+                       f[k]*(self.x[k]**2*(self.x[k] - self.x[k+1] - self.x[k+2] - self.x[k+3]) + \
+                             self.x[k]*(self.x[k+1]*self.x[k+2] + self.x[k+1]*self.x[k+3] + self.x[k+2]*self.x[k+3]) - \
+                             self.x[k+1]*self.x[k+2]*self.x[k+3])
+            w1 = 4*f[self.n-5]
+            w2 = 3*(e[self.n-5] - f[self.n-5]*(self.x[self.n-5] + self.x[self.n-4] + self.x[self.n-3] + self.x[self.n-2]))
+            w3 = 2*(ds[self.n-5] - e[self.n-5]*(self.x[self.n-5] + self.x[self.n-4] + self.x[self.n-3]) + \
+                    f[self.n-5]*(self.x[self.n-5]*(self.x[self.n-4] + self.x[self.n-3] + self.x[self.n-2]) + \
+                    self.x[self.n-4]*self.x[self.n-3] + self.x[self.n-4]*self.x[self.n-2] + self.x[self.n-3]*self.x[self.n-2]))
+            rest = s[self.n-5] - ds[self.n-5]*(self.x[self.n-5] + self.x[self.n-4]) + \
+                   e[self.n-5]*(self.x[self.n-5]*self.x[self.n-4] + self.x[self.n-5]*self.x[self.n-3] + self.x[self.n-4]*self.x[self.n-3]) - \
+                   f[self.n-5]*(self.x[self.n-4]*self.x[self.n-3]*self.x[self.n-2] + \
+                           self.x[self.n-5]*(self.x[self.n-4]*self.x[self.n-3] + self.x[self.n-4]*self.x[self.n-2] + self.x[self.n-3]*self.x[self.n-2]))
+            for k in range(self.n - 4, self.n):
+                d[k] = w1*self.x[k]**3 + w2*self.x[k]**2 + w3*self.x[k] + rest
+        return d
+
+    def _perturbder(self, d, s, ds, e):
+        nder = 3
+        dper = d.copy()
+        h = np.diff(self.x)
+        smin = np.array([self._minmod(s[k], s[k+1]) for k in range(self.n - 2)])
+        dmin = np.array([self._minmod(ds[k], ds[k+1]) for k in range(self.n - 3)])
+
+        if self.mono_constraint == 'M3':
+            dper[0] = self._minmod(d[0], nder * s[0])
+            dper[self.n-1] = self._minmod(d[self.n-1], nder * s[self.n-2])
+            dper[1] = self._minmod(d[1], nder * self._minmod(s[0], s[1]))
+            dper[self.n-2] = self._minmod(d[self.n-2], nder*self._minmod(s[self.n-3], s[self.n-2]))
+            for k in range(2, self.n - 2):
+                p1 = s[k-1] + dmin[k-2]*(self.x[k] - self.x[k-1])
+                p2 = s[k]   + dmin[k-1]*(self.x[k] - self.x[k+1])
+                t = self._minmod(p1, p2)
+                tmax = np.sign(t) * np.maximum(nder * np.abs(smin[k-1]), (nder / 2) * np.abs(t))
+                dper[k] = self._minmod(d[k], tmax)
+        elif self.mono_constraint == 'M4':
+            emin = np.array([self._minmod(e[k], e[k+1]) for k in range(self.n - 4)])
+            dper[0] = self._minmod(d[0], nder * s[0])
+            dper[self.n-1] = self._minmod(d[self.n-1], nder * s[self.n-2])
+            dper[1] = np.sign(d[1]) * np.minimum(np.abs(d[1]), nder * np.abs(s[0]))
+            dper[1] = np.sign(dper[1]) * np.minimum(np.abs(dper[1]), nder * np.abs(s[1]))
+            dper[self.n-2] = np.sign(d[self.n-2]) * np.minimum(np.abs(d[self.n-2]), nder*np.abs(s[self.n-3]))
+            dper[self.n-2] = np.sign(dper[self.n-2]) * np.minimum(np.abs(dper[self.n-2]), nder*np.abs(s[self.n-2]))
+            t = self._minmod(s[1] + dmin[0]*(self.x[2] - self.x[1]), s[2] + dmin[1]*(self.x[2] - self.x[3]))
+            tmax = np.sign(t)*max(nder*abs(smin[1]), (nder/2)*abs(t))
+            dper[2] = self._minmod(d[2], tmax)
+            t = self._minmod(s[self.n-4] + dmin[self.n-5]*(self.x[self.n-3] - self.x[self.n-4]), s[self.n-3] + dmin[self.n-4]*(self.x[self.n-3] - self.x[self.n-2]))
+            tmax = np.sign(t)*max(nder*abs(smin[self.n-4]), (nder/2)*abs(t))
+            dper[self.n-3] = self._minmod(d[self.n-3], tmax)
+            for k in range(3, self.n - 3):
+                p1 = s[k-1] + dmin[k-2]*(self.x[k] - self.x[k-1])
+                p2 = s[k]   + dmin[k-1]*(self.x[k] - self.x[k+1])
+                q1 = s[k-1] - h[k-1]*self._minmod(ds[k-2] + emin[k-3]*(self.x[k-1] - self.x[k-2]),
+                                            ds[k-1] + emin[k-2]*(self.x[k-1] - self.x[k+1]))
+                q2 = s[k]   - h[k]  *self._minmod(ds[k-1] + emin[k-2]*(self.x[k]   - self.x[k-1]),
+                                            ds[k]   + emin[k-1]*(self.x[k]   - self.x[k+2]))
+                t  = self._minmod(p1,p2)
+                tt = self._minmod(q1,q2)
+                vec = np.array([0, nder*smin[k-1], (nder/2)*t, tt])
+                min_vec = np.min(vec)
+                max_vec = np.max(vec)
+                dper[k] = d[k] + self._minmod(min_vec - d[k], max_vec - d[k])
+        return dper
+
+
+def load_data(name):
+    data_path = Path(__file__).parent.joinpath("../data").resolve().joinpath(f"{name}_data.csv")
+    data = np.genfromtxt(data_path, delimiter=',', names=True)
+    return data['x'], data['y']
+
+@pytest.mark.parametrize("config", CONFIGURATIONS)
+@pytest.mark.parametrize("name", DATASETS)
+def test_datasets_match_loop_reference(name, config):
+    x, y = load_data(name)
+    interp = pchips.PchipInterpolator(x, y, **config)
+    reference = LoopPchipInterpolator(x, y, **config)
+    np.testing.assert_array_equal(interp.coeffs, reference.coeffs)
+
+@pytest.mark.parametrize("config", CONFIGURATIONS)
+@pytest.mark.parametrize("n", [5, 6, 7, 8, 13, 200])
+def test_random_data_matches_loop_reference(n, config):
+    rng = np.random.default_rng(n)
+    for trial in range(10):
+        x = np.cumsum(rng.uniform(0.1, 2.0, n)) - rng.uniform(0.0, 50.0)
+        y = rng.normal(size=n)
+        if trial % 2:
+            y = np.cumsum(np.abs(y))
+        interp = pchips.PchipInterpolator(x, y, **config)
+        reference = LoopPchipInterpolator(x, y, **config)
+        np.testing.assert_array_equal(interp.coeffs, reference.coeffs)
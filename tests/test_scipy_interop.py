@@ -0,0 +1,84 @@
+import numpy as np
+import pytest
+import pchips
+import scipy.interpolate as interpolate
+
+CONFIGURATIONS = [
+    {'approx_order': 'cubic', 'mono_constraint': 'M4'},
+    {'approx_order': 'cubic', 'mono_constraint': 'M3'},
+    {'approx_order': 'quartic', 'mono_constraint': 'M4'},
+    {'approx_order': 'quartic', 'mono_constraint': 'M3'},
+]
+
+@pytest.fixture(scope="module")
+def data():
+    rng = np.random.default_rng(0)
+    x = np.cumsum(rng.uniform(0.1, 2.0, 30))
+    return x, np.column_stack([np.sin(x / 4) + 0.1 * x, np.cumsum(rng.uniform(0, 1, 30))])
+
+@pytest.mark.parametrize("layout", ['rows', 'columns'])
+@pytest.mark.parametrize("axis", [0, 1])
+@pytest.mark.parametrize("config", CONFIGURATIONS)
+def test_to_ppoly_is_a_view(data, config, axis, layout):
+    x, y = data
+    interp = pchips.PchipInterpolator(x, y if axis == 0 else y.T, axis=axis, layout=layout, **config)
+    ppoly = interp.to_ppoly()
+    assert ppoly.c.flags.c_contiguous
+    assert np.shares_memory(ppoly.c, interp.coeffs) == (layout == 'columns')
+    assert ppoly.x is interp.x
+    u = np.linspace(x[0] - 1, x[-1] + 1, 301)
+    np.testing.assert_allclose(ppoly(u), interp(u), rtol=1e-12, atol=1e-12)
+    np.testing.assert_allclose(ppoly(u, nu=1), interp(u, nu=1), rtol=1e-12, atol=1e-12)
+    np.testing.assert_allclose(ppoly.integrate(x[2], u[100]), interp.integrate(x[2], u[100]), rtol=1e-12)
+
+@pytest.mark.parametrize("config", CONFIGURATIONS)
+def test_to_hermite(data, config):
+    x, y = data
+    interp = pchips.PchipInterpolator(x, y.T, axis=1, **config)
+    knots, values, dydx = interp.to_hermite()
+    assert knots is interp.x
+    assert np.shares_memory(values, interp.y)
+    np.testing.assert_array_equal(values, y.T)
+    np.testing.assert_allclose(dydx, interp(x, nu=1), rtol=1e-12, atol=1e-12)
+    np.testing.assert_array_equal(dydx[:, :-1], interp.coeffs[:, 2].T)
+
+    # Huynh's derivatives through SciPy's Hermite construction give the same curve.
+    spline = interpolate.CubicHermiteSpline(knots, values, dydx, axis=1)
+    u = np.linspace(x[0], x[-1], 301)
+    np.testing.assert_allclose(spline(u), interp(u), rtol=1e-12, atol=1e-12)
+
+def test_from_ppoly(data):
+    x, y = data
+    interp = pchips.PchipInterpolator(x, y[:, 0], layout='columns')
+    wrapped = pchips.PchipInterpolator.from_ppoly(interp.to_ppoly())
+    assert np.shares_memory(wrapped.coeffs, interp.coeffs)
+    np.testing.assert_array_equal(wrapped.x, interp.x)
+    np.testing.assert_allclose(wrapped.y, interp.y, rtol=1e-12, atol=1e-12)
+    u = np.linspace(x[0] - 1, x[-1] + 1, 301)
+    np.testing.assert_array_equal(wrapped(u), interp(u))
+
+    scipy_pchip = interpolate.PchipInterpolator(x, y, axis=0)
+    wrapped = pchips.PchipInterpolator.from_ppoly(scipy_pchip)
+    np.testing.assert_allclose(wrapped(u), scipy_pchip(u), rtol=1e-12, atol=1e-12)
+    np.testing.assert_allclose(wrapped(u, nu=2), scipy_pchip(u, nu=2), rtol=1e-12, atol=1e-12)
+    np.testing.assert_allclose(wrapped(u, chunk_size=50), wrapped(u))
+    np.testing.assert_allclose(wrapped.integrate(x[0], u), [scipy_pchip.integrate(x[0], b) for b in u],
+                               rtol=1e-10, atol=1e-10)
+
+    quadratic = interpolate.PPoly(np.ones((3, 4)), np.arange(5.0))
+    wrapped = pchips.PchipInterpolator.from_ppoly(quadratic)
+    np.testing.assert_allclose(wrapped(u / 10), quadratic(u / 10), rtol=1e-12, atol=1e-12)
+    with pytest.raises(ValueError):
+        pchips.PchipInterpolator.from_ppoly(interpolate.PPoly(np.ones((4, 3)), np.arange(4.0)[::-1]))
+
+
+def test_wrapped_ppoly_rejects_refits(data):
+    x, y = data
+    wrapped = pchips.PchipInterpolator.from_ppoly(interpolate.PchipInterpolator(x, y[:, 0]))
+    coeffs = wrapped.coeffs.copy()
+    with pytest.raises(ValueError):
+        wrapped.append(x[-1] + 1, 0.0)
+    with pytest.raises(ValueError):
+        wrapped.update(3, 0.0)
+    assert wrapped.n == len(x)
+    np.testing.assert_array_equal(wrapped.coeffs, coeffs)
@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+import pchips
+
+CONFIGURATIONS = [
+    {'approx_order': 'cubic', 'mono_constraint': 'M4'},
+    {'approx_order': 'quartic', 'mono_constraint': 'M3'},
+]
+
+STORAGE = [(np.float64, 'columns'), (np.float32, 'rows'), (np.float32, 'columns')]
+
+@pytest.fixture(scope="module")
+def data():
+    rng = np.random.default_rng(0)
+    x = np.cumsum(rng.uniform(0.1, 2.0, 60))
+    y = np.column_stack([np.sin(x / 5), np.cumsum(rng.uniform(0, 1, 60))])
+    u = rng.uniform(x[0] - 1, x[-1] + 1, 1000)
+    return x, y, u
+
+@pytest.mark.parametrize("storage", STORAGE)
+@pytest.mark.parametrize("config", CONFIGURATIONS)
+def test_storage_matches_float64(data, config, storage):
+    x, y, u = data
+    dtype, layout = storage
+    reference = pchips.PchipInterpolator(x, y, **config)
+    interp = pchips.PchipInterpolator(x, y, dtype=dtype, layout=layout, **config)
+    assert interp.coeffs.shape == reference.coeffs.shape
+    assert interp.coeffs.dtype == dtype
+    assert interp.coeffs[:, 0].flags.c_contiguous == (layout == 'columns')
+    np.testing.assert_array_equal(interp.coeffs, reference.coeffs.astype(dtype))
+
+    tol = 0 if dtype == np.float64 else 1e-5
+    for nu in range(3):
+        expected = reference(u, nu=nu)
+        result = interp(u, nu=nu)
+        assert result.dtype == np.float64
+        np.testing.assert_allclose(result, expected, rtol=tol, atol=tol)
+        np.testing.assert_array_equal(interp(u, nu=nu, chunk_size=77), result)
+    np.testing.assert_allclose(interp.integrate(x[0], u), reference.integrate(x[0], u), rtol=tol, atol=tol)
+
+def test_query_dtype_is_preserved(data):
+    x, y, u = data
+    u32 = u.astype(np.float32)
+    for dtype in (np.float64, np.float32):
+        interp = pchips.PchipInterpolator(x, y[:, 0], dtype=dtype)
+        assert interp(u32).dtype == np.float32
+        assert interp(u32, chunk_size=100).dtype == np.float32
+        assert interp(u32, nu=1).dtype == np.float32
+        assert interp(u).dtype == np.float64
+        assert interp(np.arange(5)).dtype == np.float64
+        np.testing.assert_array_equal(interp(u32, chunk_size=100), interp(u32))
+    # float64 tables evaluate float32 queries in float64 and round once at the end.
+    interp = pchips.PchipInterpolator(x, y[:, 0])
+    np.testing.assert_array_equal(interp(u32), interp(u32.astype(np.float64)).astype(np.float32))
+
+def test_append_and_export_keep_storage(data):
+    x, y, _ = data
+    interp = pchips.PchipInterpolator(x[:20], y[:20, 0], dtype=np.float32, layout='columns')
+    interp.append(x[20:], y[20:, 0])
+    full = pchips.PchipInterpolator(x, y[:, 0], dtype=np.float32, layout='columns')
+    assert interp.coeffs.dtype == np.float32 and interp.coeffs[:, 0].flags.c_contiguous
+    np.testing.assert_array_equal(interp.coeffs, full.coeffs)
+    np.testing.assert_allclose(full.to_ppoly()(x), full(x), rtol=1e-12, atol=1e-12)
+
+def test_storage_validation(data):
+    x, y, _ = data
+    with pytest.raises(ValueError):
+        pchips.PchipInterpolator(x, y, dtype=np.float16)
+    with pytest.raises(ValueError):
+        pchips.PchipInterpolator(x, y, layout='diagonal')